@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 import re
 
@@ -7,6 +7,13 @@ from audiobook_generator.config.general_config import GeneralConfig
 EPUB = "epub"
 MARKDOWN = "markdown"
 
+# Text-cleanup patterns shared by the book parsers
+WS_RE = re.compile(r"\s+")
+ENDNOTE_RE = re.compile(r'(?<=[a-zA-Z.,!?;\"”)])\d+')
+REF_RE = re.compile(r'\[\d+(\.\d+)?\]')
+NL_PLUS_RE = re.compile(r"\n+")
+NL_2PLUS_RE = re.compile(r"\n{2,}")
+
 
 class BaseBookParser:  # Base interface for books parsers
     # Base Book Parser interface
@@ -32,6 +39,10 @@ class BaseBookParser:  # Base interface for books parsers
     def get_chapters(self, break_string) -> List[Tuple[str, str]]:
         raise NotImplementedError
 
+    def iter_chapters(self, break_string) -> Iterator[Tuple[str, str]]:
+        # Parsers that can build chapters lazily override this
+        return iter(self.get_chapters(break_string))
+
     @staticmethod
     def sanitize_title(title: str, break_string: str) -> str:
         """Prepare chapter titles for use in file names and ID3 tags."""
@@ -1,16 +1,25 @@
 import logging
 import re
-from typing import List, Tuple
+from typing import List, Pattern, Tuple
 
 import ebooklib
 from bs4 import BeautifulSoup
 from ebooklib import epub
 
-from audiobook_generator.book_parsers.base_book_parser import BaseBookParser
+from audiobook_generator.book_parsers.base_book_parser import (
+    BaseBookParser,
+    ENDNOTE_RE,
+    NL_2PLUS_RE,
+    NL_PLUS_RE,
+    REF_RE,
+    WS_RE,
+)
 from audiobook_generator.config.general_config import GeneralConfig
 
 logger = logging.getLogger(__name__)
 
+_NUMERIC_TITLE_RE = re.compile(r'^\d{1,3}$')
+
 
 class EpubBookParser(BaseBookParser):
     def __init__(self, config: GeneralConfig):
@@ -50,31 +59,32 @@ class EpubBookParser(BaseBookParser):
 
             # Replace excessive whitespaces and newline characters based on the mode
             if self.config.newline_mode == "single":
-                cleaned_text = re.sub(r"[\n]+", break_string, raw.strip())
+                cleaned_text = NL_PLUS_RE.sub(break_string, raw.strip())
             elif self.config.newline_mode == "double":
-                cleaned_text = re.sub(r"[\n]{2,}", break_string, raw.strip())
+                cleaned_text = NL_2PLUS_RE.sub(break_string, raw.strip())
             elif self.config.newline_mode == "none":
-                cleaned_text = re.sub(r"[\n]+", " ", raw.strip())
+                cleaned_text = NL_PLUS_RE.sub(" ", raw.strip())
             else:
                 raise ValueError(f"Invalid newline mode: {self.config.newline_mode}")
 
             logger.debug(f"Cleaned text step 1: <{cleaned_text[:]}>")
-            cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+            cleaned_text = WS_RE.sub(" ", cleaned_text)
             logger.debug(f"Cleaned text step 2: <{cleaned_text[:100]}>")
 
             # Removes end-note numbers
             if self.config.remove_endnotes:
-                cleaned_text = re.sub(r'(?<=[a-zA-Z.,!?;”")])\d+', "", cleaned_text)
+                cleaned_text = ENDNOTE_RE.sub("", cleaned_text)
                 logger.debug(f"Cleaned text step 4: <{cleaned_text[:100]}>")
 
             # Removes references numbers like [1] or [2.3]
             if self.config.remove_reference_numbers:
-                cleaned_text = re.sub(r'\[\d+(\.\d+)?\]', '', cleaned_text)
+                cleaned_text = REF_RE.sub('', cleaned_text)
                 logger.debug(f"Cleaned text step 4.1 (removed brackets): <{cleaned_text[:100]}>")
 
-            # Does user defined search and replaces
-            for search_and_replace in search_and_replaces:
-                cleaned_text = re.sub(search_and_replace['search'], search_and_replace['replace'], cleaned_text)
+            # Does user defined search and replaces, in file order: a rule sees
+            # the output of the rules before it, so they are not fused into one pattern.
+            for pattern, replace in search_and_replaces:
+                cleaned_text = pattern.sub(replace, cleaned_text)
             logger.debug(f"Cleaned text step 5: <{cleaned_text[:100]}>")
 
             # Get proper chapter title
@@ -85,7 +95,7 @@ class EpubBookParser(BaseBookParser):
                     if soup.find(level):
                         title = soup.find(level).text
                         break
-                if title.strip() == "" or re.match(r'^\d{1,3}$',title) is not None:
+                if title.strip() == "" or _NUMERIC_TITLE_RE.match(title) is not None:
                     title = cleaned_text[:60]
             elif self.config.title_mode == "tag_text":
                 title = ""
@@ -108,12 +118,15 @@ class EpubBookParser(BaseBookParser):
             soup.decompose()
         return chapters
 
-    def get_search_and_replaces(self):
+    def get_search_and_replaces(self) -> List[Tuple[Pattern[str], str]]:
+        # Compiled once per book rather than looked up in re's cache for every
+        # rule in every chapter.
         search_and_replaces = []
         if self.config.search_and_replace_file:
             with open(self.config.search_and_replace_file) as fp:
                 search_and_replace_content = fp.readlines()
                 for search_and_replace in search_and_replace_content:
                     if '==' in search_and_replace and not search_and_replace.startswith('==') and not search_and_replace.endswith('==') and not search_and_replace.startswith('#'):
-                        search_and_replaces = search_and_replaces + [ {'search': r"{}".format(search_and_replace.split('==')[0]), 'replace': r"{}".format(search_and_replace.split('==')[1][:-1])} ]
+                        search, replace = search_and_replace.split('==', 1)
+                        search_and_replaces.append((re.compile(search), replace.rstrip('\r\n')))
         return search_and_replaces
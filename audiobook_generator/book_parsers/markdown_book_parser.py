@@ -1,23 +1,81 @@
 import logging
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
 
-from audiobook_generator.book_parsers.base_book_parser import BaseBookParser
+from audiobook_generator.book_parsers.base_book_parser import (
+    BaseBookParser,
+    ENDNOTE_RE,
+    REF_RE,
+    WS_RE,
+)
 from audiobook_generator.config.general_config import GeneralConfig
 
 logger = logging.getLogger(__name__)
 
+_FRONT_MATTER_BLOCK = re.compile(
+    r"\A---[^\S\n]*\n(.*?)^---[^\S\n]*(?:\n|\Z)", re.DOTALL | re.MULTILINE
+)
+_META_LINE = re.compile(
+    r"^(?P<key>[A-Za-z0-9_\- ]+):[^\S\n]*(?P<value>.+)$", re.MULTILINE
+)
+_H1_RE = re.compile(r"^[^\S\n]*#[^\S\n]+(.*)$", re.MULTILINE)
+_CHAPTER_HEADING_RE = re.compile(r"^[^\S\n]*(#{1,2})[^\S\n]+(.*)$", re.MULTILINE)
+# Newline runs for the "single" and "double" modes. Lines holding only spaces
+# or tabs (e.g. left behind by a stripped code block or an empty "> " line)
+# count as blank.
+_LINE_BREAKS_RE = re.compile(r"\n(?:[^\S\n]*\n)*")
+_BLANK_LINES_RE = re.compile(r"\n(?:[^\S\n]*\n)+")
 
-class MarkdownBookParser(BaseBookParser):
-    FRONT_MATTER_DELIMITER = re.compile(r"^---\s*$")
-    METADATA_PATTERN = re.compile(r"^(?P<key>[A-Za-z0-9_\- ]+):\s*(?P<value>.+)$")
-    HEADING_PATTERN = re.compile(r"^\s*(#{1,6})\s+(.*)$")
+# Invisible characters that only confuse TTS engines: soft hyphen, zero-width
+# space, word joiner, BOM and non-whitespace C0 control characters.
+_INVISIBLE_CHARS = str.maketrans(
+    "",
+    "",
+    "\u00ad\u200b\u2060\ufeff"
+    + "".join(map(chr, [*range(0x00, 0x09), *range(0x0E, 0x1C), 0x7F])),
+)
+
+# Inline constructs whose inner text is kept (and itself stripped of nested markup).
+_INLINE_MARKDOWN = (
+    r"(?P<code>(?s:```.*?```))"  # code blocks
+    r"|(?P<inline>`(?P<inline_text>[^`]*)`)"  # inline code
+    r"|(?P<img>!\[(?P<img_text>[^\]]*)\]\([^\)]*\))"  # images
+    r"|(?P<link>\[(?P<link_text>[^\]]+)\]\([^\)]*\))"  # links
+    r"|(?P<bold>(?P<bold_mark>\*\*|__)(?P<bold_text>.*?)(?P=bold_mark))"  # bold
+    r"|(?P<ital>(?P<ital_mark>\*|_)(?P<ital_text>.*?)(?P=ital_mark))"  # italic
+)
+# Line-start markers: blockquotes, bullet list, numbered list, headings. The
+# lookahead keeps the group from matching an empty prefix on every line.
+_LINE_PREFIX_MARKDOWN = (
+    r"(?P<prefix>^(?=>|\s{0,3}[-*+]\s|\s*\d+\.\s|\s*#)"
+    r"(?:>+\s?)?(?:\s{0,3}[-*+]\s+)?(?:\s*\d+\.\s+)?(?:\s*#{1,6}\s*)?)"
+)
+# The leading lookahead lets the engine skip plain prose without trying every branch.
+_INLINE_MARKDOWN_RE = re.compile(rf"(?=[`!\[*_])(?:{_INLINE_MARKDOWN})")
+_MARKDOWN_RE = re.compile(
+    rf"(?=[`!\[*_]|^)(?:{_INLINE_MARKDOWN}|{_LINE_PREFIX_MARKDOWN})", re.MULTILINE
+)
+
+
+def _markdown_repl(match: "re.Match[str]") -> str:
+    kind = match.lastgroup
+    if kind in ("code", "prefix"):
+        return ""
+    return _INLINE_MARKDOWN_RE.sub(_markdown_repl, match.group(f"{kind}_text"))
 
+
+class MarkdownBookParser(BaseBookParser):
     def __init__(self, config: GeneralConfig):
         super().__init__(config)
+        self._newline_fn = {
+            "single": self._collapse_single,
+            "double": self._collapse_double,
+            "none": self._collapse_none,
+        }[self.config.newline_mode]
         self.raw_text = self._read_file()
-        self.metadata, self.body_lines = self._extract_front_matter(self.raw_text)
+        self.metadata, self.body_text = self._extract_front_matter(self.raw_text)
+        self._search_and_replaces = self._load_search_and_replaces()
 
     def __str__(self) -> str:
         return super().__str__()
@@ -33,6 +91,10 @@ class MarkdownBookParser(BaseBookParser):
             raise FileNotFoundError(
                 f"Markdown Parser: Input file not found: {self.config.input_file}"
             )
+        if self.config.newline_mode not in ("single", "double", "none"):
+            raise ValueError(
+                f"Markdown Parser: Invalid newline mode: {self.config.newline_mode}"
+            )
 
     def get_book(self):
         return self.raw_text
@@ -41,10 +103,9 @@ class MarkdownBookParser(BaseBookParser):
         if "title" in self.metadata:
             return self.metadata["title"]
 
-        for line in self.body_lines:
-            heading_match = self.HEADING_PATTERN.match(line)
-            if heading_match and len(heading_match.group(1)) == 1:
-                return heading_match.group(2).strip()
+        heading_match = _H1_RE.search(self.body_text)
+        if heading_match:
+            return heading_match.group(1).strip()
 
         return os.path.splitext(os.path.basename(self.config.input_file))[0]
 
@@ -55,64 +116,52 @@ class MarkdownBookParser(BaseBookParser):
         return "Unknown"
 
     def get_chapters(self, break_string) -> List[Tuple[str, str]]:
-        chapters: List[Tuple[str, str]] = []
-        search_and_replaces = self.get_search_and_replaces()
+        return list(self.iter_chapters(break_string))
+
+    def iter_chapters(self, break_string) -> Iterator[Tuple[str, str]]:
+        break_token = f" {break_string.strip()} "
         current_title: Optional[str] = None
-        current_lines: List[str] = []
+        body_start = 0
         fallback_index = 1
 
-        for line in self.body_lines:
-            heading_match = self.HEADING_PATTERN.match(line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                heading_text = heading_match.group(2).strip()
-                if level <= 2:
-                    if current_title is not None or current_lines:
-                        chapter_text = self._build_chapter_text(
-                            current_lines,
-                            break_string,
-                            search_and_replaces,
-                            current_title,
-                        )
-                        if chapter_text:
-                            title_source = current_title or f"Chapter {fallback_index}"
-                            sanitized_title = self.sanitize_title(
-                                title_source, break_string
-                            )
-                            chapters.append((sanitized_title, chapter_text))
-                            fallback_index += 1
-                    current_title = heading_text
-                    current_lines = []
-                    continue
-            current_lines.append(line)
-
-        if current_title is not None or current_lines:
+        # Only H1/H2 headings start a new chapter; slice the body between them.
+        for heading_match in _CHAPTER_HEADING_RE.finditer(self.body_text):
             chapter_text = self._build_chapter_text(
-                current_lines,
-                break_string,
-                search_and_replaces,
+                self.body_text[body_start:heading_match.start()],
+                break_token,
                 current_title,
             )
             if chapter_text:
                 title_source = current_title or f"Chapter {fallback_index}"
-                sanitized_title = self.sanitize_title(title_source, break_string)
-                chapters.append((sanitized_title, chapter_text))
+                yield self.sanitize_title(title_source, break_string), chapter_text
+                fallback_index += 1
+            current_title = heading_match.group(2).strip()
+            body_start = heading_match.end()
 
-        if not chapters and self.body_lines:
+        chapter_text = self._build_chapter_text(
+            self.body_text[body_start:],
+            break_token,
+            current_title,
+        )
+        if chapter_text:
+            title_source = current_title or f"Chapter {fallback_index}"
+            yield self.sanitize_title(title_source, break_string), chapter_text
+            fallback_index += 1
+
+        if fallback_index == 1 and self.body_text:  # nothing was yielded above
             text = self._build_chapter_text(
-                self.body_lines,
-                break_string,
-                search_and_replaces,
+                self.body_text,
+                break_token,
                 self.get_book_title(),
             )
             if text:
                 title_source = self.get_book_title() or "Chapter 1"
-                sanitized_title = self.sanitize_title(title_source, break_string)
-                chapters.append((sanitized_title, text))
+                yield self.sanitize_title(title_source, break_string), text
 
-        return chapters
+    def get_search_and_replaces(self) -> List[Tuple[Pattern[str], str]]:
+        return self._search_and_replaces
 
-    def get_search_and_replaces(self):
+    def _load_search_and_replaces(self) -> List[Tuple[Pattern[str], str]]:
         search_and_replaces = []
         if self.config.search_and_replace_file:
             with open(self.config.search_and_replace_file) as fp:
@@ -124,10 +173,9 @@ class MarkdownBookParser(BaseBookParser):
                         and not search_and_replace.endswith("==")
                         and not search_and_replace.startswith("#")
                     ):
-                        search = search_and_replace.split("==")[0]
-                        replace = search_and_replace.split("==")[1][:-1]
+                        search, replace = search_and_replace.split("==", 1)
                         search_and_replaces.append(
-                            {"search": rf"{search}", "replace": rf"{replace}"}
+                            (re.compile(search), replace.rstrip("\r\n"))
                         )
         return search_and_replaces
 
@@ -135,91 +183,79 @@ class MarkdownBookParser(BaseBookParser):
         with open(self.config.input_file, "r", encoding="utf-8") as fp:
             return fp.read()
 
-    def _extract_front_matter(self, text: str) -> Tuple[Dict[str, str], List[str]]:
-        lines = text.splitlines()
-        metadata: Dict[str, str] = {}
-        body_start = 0
+    def _extract_front_matter(self, text: str) -> Tuple[Dict[str, str], str]:
+        front_matter = _FRONT_MATTER_BLOCK.match(text)
+        if not front_matter:
+            return {}, text
 
-        if lines and self.FRONT_MATTER_DELIMITER.match(lines[0]):
-            for idx in range(1, len(lines)):
-                if self.FRONT_MATTER_DELIMITER.match(lines[idx]):
-                    body_start = idx + 1
-                    break
-                meta_match = self.METADATA_PATTERN.match(lines[idx])
-                if meta_match:
-                    key = meta_match.group("key").strip().lower()
-                    value = meta_match.group("value").strip()
-                    metadata[key] = value
-        else:
-            body_start = 0
-
-        body_lines = lines[body_start:]
-        return metadata, body_lines
+        metadata: Dict[str, str] = {}
+        for meta_match in _META_LINE.finditer(front_matter.group(1)):
+            key = meta_match.group("key").strip().lower()
+            metadata[key] = meta_match.group("value").strip()
+        return metadata, text[front_matter.end():]
 
     def _build_chapter_text(
         self,
-        lines: List[str],
-        break_string: str,
-        search_and_replaces: List[Dict[str, str]],
+        body: str,
+        break_token: str,
         heading: Optional[str] = None,
     ) -> str:
-        if not lines and not heading:
-            return ""
-
-        parts: List[str] = []
-        if heading:
-            heading_text = heading.strip()
-            if heading_text:
-                parts.append(heading_text)
-        if lines:
-            body_text = "\n".join(lines).strip()
-            if body_text:
-                parts.append(body_text)
-
-        text = "\n\n".join(parts).strip()
+        # Both parts are already stripped, so only join when there are two of
+        # them and skip the extra strip over the whole chapter.
+        heading_text = heading.strip() if heading else ""
+        body_text = body.strip()
+        if heading_text and body_text:
+            text = f"{heading_text}\n\n{body_text}"
+        else:
+            text = heading_text or body_text
         if not text:
             return ""
 
-        text = self._strip_markdown(text)
-        text = self._apply_newline_mode(text, break_string)
+        # Trim blank lines left at the edges by removed blocks (e.g. a fenced
+        # code block opening the chapter) so they never become a break.
+        text = self._strip_markdown(text).strip()
+        text = self._apply_newline_mode(text, break_token)
 
         if self.config.remove_endnotes:
-            text = re.sub(r'(?<=[a-zA-Z.,!?;\"”)])\d+', "", text)
+            text = ENDNOTE_RE.sub("", text)
         if self.config.remove_reference_numbers:
-            text = re.sub(r'\[\d+(\.\d+)?\]', "", text)
+            text = REF_RE.sub("", text)
 
-        for search_and_replace in search_and_replaces:
-            text = re.sub(
-                search_and_replace["search"],
-                search_and_replace["replace"],
-                text,
-            )
+        for pattern, replace in self._search_and_replaces:
+            text = pattern.sub(replace, text)
 
-        text = re.sub(r"\s+", " ", text).strip()
+        text = self._strip_edge_breaks(text, break_token)
+        text = WS_RE.sub(" ", text).strip()
         return text
 
-    def _apply_newline_mode(self, text: str, break_string: str) -> str:
-        text = text.replace("\r\n", "\n")
-        if self.config.newline_mode == "single":
-            cleaned = re.sub(r"\n+", f" {break_string.strip()} ", text)
-        elif self.config.newline_mode == "double":
-            cleaned = re.sub(r"\n{2,}", f" {break_string.strip()} ", text)
-            cleaned = re.sub(r"\n", " ", cleaned)
-        elif self.config.newline_mode == "none":
-            cleaned = re.sub(r"\n", " ", text)
-        else:
-            raise ValueError(f"Invalid newline mode: {self.config.newline_mode}")
-        return cleaned
+    @staticmethod
+    def _strip_edge_breaks(text: str, break_token: str) -> str:
+        # A first or last paragraph removed by the passes above leaves its
+        # break behind. Only whole tokens are dropped: the text was stripped
+        # before the newline collapse, so a mark with whitespace on both sides
+        # at an edge is always one we inserted, even when the mark is a plain
+        # "." (Piper) that also ends the chapter's last sentence.
+        mark = re.escape(break_token.strip())
+        if not mark:
+            return text
+        return re.sub(rf"^(?:\s+{mark}(?=\s))+|(?:\s+{mark}(?=\s))+\s*$", "", text)
+
+    def _apply_newline_mode(self, text: str, break_token: str) -> str:
+        return self._newline_fn(text, break_token)
+
+    # _read_file opens the book in text mode, so line endings are already "\n".
+    @staticmethod
+    def _collapse_single(text: str, break_token: str) -> str:
+        return _LINE_BREAKS_RE.sub(break_token, text)
+
+    @staticmethod
+    def _collapse_double(text: str, break_token: str) -> str:
+        return _BLANK_LINES_RE.sub(break_token, text).replace("\n", " ")
+
+    @staticmethod
+    def _collapse_none(text: str, break_token: str) -> str:
+        return text.replace("\n", " ")
 
     def _strip_markdown(self, text: str) -> str:
-        text = re.sub(r"```.*?```", "", text, flags=re.DOTALL)  # remove code blocks
-        text = re.sub(r"`([^`]*)`", r"\1", text)  # inline code
-        text = re.sub(r"!\[([^\]]*)\]\([^\)]*\)", r"\1", text)  # images
-        text = re.sub(r"\[([^\]]+)\]\([^\)]*\)", r"\1", text)  # links
-        text = re.sub(r"(\*\*|__)(.*?)\1", r"\2", text)  # bold
-        text = re.sub(r"(\*|_)(.*?)\1", r"\2", text)  # italic
-        text = re.sub(r"^>+\s?", "", text, flags=re.MULTILINE)  # blockquotes
-        text = re.sub(r"^\s{0,3}[-*+]\s+", "", text, flags=re.MULTILINE)  # bullet list
-        text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)  # numbered list
-        text = re.sub(r"^\s*(#{1,6})\s*", "", text, flags=re.MULTILINE)  # headings
-        return text
+        text = text.translate(_INVISIBLE_CHARS)
+        return _MARKDOWN_RE.sub(_markdown_repl, text)
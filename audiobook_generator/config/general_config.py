@@ -10,6 +10,10 @@ class GeneralConfig:
         self.no_prompt = getattr(args, 'no_prompt', None)
         self.worker_count = getattr(args, 'worker_count', None)
         self.use_pydub_merge = getattr(args, 'use_pydub_merge', None)
+        self.skip_audio_normalization = getattr(args, 'skip_audio_normalization', None)
+        self.tts_cache_dir = getattr(args, 'tts_cache_dir', None)
+        self.no_tts_cache = getattr(args, 'no_tts_cache', None)
+        self.tts_cache_size_mb = getattr(args, 'tts_cache_size_mb', None)
 
         # Book parser specific arguments
         self.title_mode = getattr(args, 'title_mode', None)
@@ -56,12 +60,14 @@ class GeneralConfig:
         self.gemini_channels = getattr(args, 'gemini_channels', None)
         self.gemini_speaker_map = getattr(args, 'gemini_speaker_map', None)
         self.gemini_temperature = getattr(args, 'gemini_temperature', None)
+        self.gemini_concurrency = getattr(args, 'gemini_concurrency', None)
 
         # TTS provider: Qwen3 specific arguments
         self.qwen_api_key = getattr(args, 'qwen_api_key', None)
         self.qwen_language_type = getattr(args, 'qwen_language_type', None)
         self.qwen_stream = getattr(args, 'qwen_stream', None)
         self.qwen_request_timeout = getattr(args, 'qwen_request_timeout', None)
+        self.qwen_concurrency = getattr(args, 'qwen_concurrency', None)
 
         # TTS provider: MiniMax specific arguments
         self.minimax_api_key = getattr(args, 'minimax_api_key', None)
@@ -70,6 +76,8 @@ class GeneralConfig:
         self.minimax_pitch = getattr(args, 'minimax_pitch', None)
         self.minimax_language_boost = getattr(args, 'minimax_language_boost', None)
         self.minimax_request_timeout = getattr(args, 'minimax_request_timeout', None)
+        self.minimax_concurrency = getattr(args, 'minimax_concurrency', None)
+        self.minimax_use_queue = getattr(args, 'minimax_use_queue', None)
 
     def __str__(self):
         return ",\n".join(f"{key}={value}" for key, value in self.__dict__.items())
@@ -5,11 +5,16 @@ import os
 from audiobook_generator.book_parsers.base_book_parser import get_book_parser
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
-from audiobook_generator.tts_providers.base_tts_provider import get_tts_provider
+from audiobook_generator.tts_providers.base_tts_provider import TTS_PIPER, get_tts_provider
 from audiobook_generator.utils.log_handler import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Set once per worker process by _init_worker, so each chapter task only ships
+# (idx, title, text) instead of re-pickling the generator and parsed book.
+_worker_generator = None
+_worker_book_parser = None
+
 
 def confirm_conversion():
     logger.info("Do you want to continue? (y/n)")
@@ -19,6 +24,15 @@ def confirm_conversion():
         exit(0)
 
 
+def get_default_worker_count(config, chapter_count):
+    # Local Piper synthesis is CPU bound, so spread chapters over the cores.
+    # Cloud providers are rate limited and already parallelize the chunks of a
+    # chapter, and Docker Piper runs a single shared container, so they keep one.
+    if config.tts == TTS_PIPER and config.piper_path:
+        return max(1, min(os.cpu_count() or 1, chapter_count))
+    return 1
+
+
 def get_total_chars(chapters):
     total_characters = 0
     for title, text in chapters:
@@ -66,11 +80,6 @@ class AudiobookGenerator:
             logger.exception(f"Error processing chapter {idx}, error: {e}")
             return False
 
-    def process_chapter_wrapper(self, args):
-        """Wrapper for process_chapter to handle unpacking args for imap."""
-        idx, title, text, book_parser = args
-        return idx, self.process_chapter(idx, title, text, book_parser)
-
     def run(self):
         try:
             logger.info("Starting audiobook generation...")
@@ -123,7 +132,7 @@ class AudiobookGenerator:
             # Prepare chapters for processing
             chapters_to_process = chapters[self.config.chapter_start - 1 : self.config.chapter_end]
             tasks = [
-                (idx, title, text, book_parser)
+                (idx, title, text)
                 for idx, (title, text) in enumerate(
                     chapters_to_process, start=self.config.chapter_start
                 )
@@ -132,14 +141,18 @@ class AudiobookGenerator:
             # Track failed chapters
             failed_chapters = []
 
+            if not self.config.worker_count:
+                self.config.worker_count = get_default_worker_count(self.config, len(tasks))
+                logger.info(f"Using {self.config.worker_count} worker(s).")
+
             # Use multiprocessing to process chapters in parallel
             with multiprocessing.Pool(
                 processes=self.config.worker_count,
-                initializer=setup_logging,
-                initargs=(self.config.log, self.config.log_file, True)
+                initializer=_init_worker,
+                initargs=(self, book_parser),
             ) as pool:
                 # Process chapters and collect results
-                results = list(pool.imap_unordered(self.process_chapter_wrapper, tasks))
+                results = list(pool.imap_unordered(_process_chapter_task, tasks))
 
                 # Check for failed chapters
                 for idx, success in results:
@@ -162,3 +175,16 @@ class AudiobookGenerator:
         finally:
             logger.debug("AudiobookGenerator.run() method finished.")
 
+
+def _init_worker(generator, book_parser):
+    """Pool initializer: receives the already-built config once per worker."""
+    global _worker_generator, _worker_book_parser
+    setup_logging(generator.config.log, generator.config.log_file, True)
+    _worker_generator = generator
+    _worker_book_parser = book_parser
+
+
+def _process_chapter_task(task):
+    """Unpack an (idx, title, text) task for imap and process it in this worker."""
+    idx, title, text = task
+    return idx, _worker_generator.process_chapter(idx, title, text, _worker_book_parser)
@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 from audiobook_generator.config.general_config import GeneralConfig
 
@@ -37,8 +38,9 @@ class BaseTTSProvider:  # Base interface for TTS providers
 
 
 # Common support methods for all TTS providers
-def get_supported_tts_providers() -> List[str]:
-    return [TTS_AZURE, TTS_OPENAI, TTS_EDGE, TTS_GEMINI, TTS_QWEN3, TTS_MINIMAX, TTS_PIPER]
+@lru_cache(maxsize=None)
+def get_supported_tts_providers() -> Tuple[str, ...]:
+    return (TTS_AZURE, TTS_OPENAI, TTS_EDGE, TTS_GEMINI, TTS_QWEN3, TTS_MINIMAX, TTS_PIPER)
 
 
 def get_tts_provider(config) -> BaseTTSProvider:
@@ -1,23 +1,28 @@
-import base64
-import io
+import binascii
 import json
 import logging
 import math
 import os
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+import httpx
 from google import genai
 from google.genai import types
 from pydub import AudioSegment
 
+try:
+    import h2  # type: ignore  # noqa: F401  # enables HTTP/2 in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.tts_providers.base_tts_provider import BaseTTSProvider
-from audiobook_generator.utils.utils import (
-    merge_audio_segments,
-    set_audio_tags,
-    split_text,
-)
+from audiobook_generator.utils.utils import set_audio_tags, split_text
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +35,11 @@ DEFAULT_BREAK_STRING = " @BRK#"
 DEFAULT_MAX_CHARS = 1800
 DEFAULT_PRICE_PER_1000_CHARS = 0.0
 DEFAULT_TEMPERATURE = 0.2
+DEFAULT_CONCURRENCY = 4
+MAX_RETRIES = 4
+RETRY_BACKOFF_SECONDS = 2
 
-_SUPPORTED_VOICES = [
+_SUPPORTED_VOICES_TUPLE = (
     "Zephyr",
     "Puck",
     "Charon",
@@ -62,7 +70,8 @@ _SUPPORTED_VOICES = [
     "Sadachbia",
     "Sadaltager",
     "Sulafat",
-]
+)
+_SUPPORTED_VOICES = frozenset(_SUPPORTED_VOICES_TUPLE)
 
 _SUPPORTED_OUTPUT_FORMATS = {"wav", "mp3", "flac", "ogg", "opus", "aac"}
 _SUPPORTED_ENCODINGS = {
@@ -81,7 +90,7 @@ _SUPPORTED_MODELS = [
 
 
 def get_gemini_supported_voices() -> List[str]:
-    return list(_SUPPORTED_VOICES)
+    return list(_SUPPORTED_VOICES_TUPLE)
 
 
 def get_gemini_supported_output_formats() -> List[str]:
@@ -92,6 +101,22 @@ def get_gemini_supported_models() -> List[str]:
     return list(_SUPPORTED_MODELS)
 
 
+@lru_cache(maxsize=None)
+def _get_shared_client(pid: int, api_key: str, concurrency: int) -> genai.Client:
+    # One pooled keep-alive client shared by all chunk workers and, since a
+    # provider is built per chapter, by every chapter of this process. genai
+    # never closes a caller-supplied httpx client, so it must not be rebuilt per
+    # provider. Keyed by pid so forked chapter workers get their own sockets.
+    http = httpx.Client(
+        http2=h2 is not None,
+        limits=httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        ),
+    )
+    return genai.Client(api_key=api_key, http_options=types.HttpOptions(httpx_client=http))
+
+
 class GeminiTTSProvider(BaseTTSProvider):
     def __init__(self, config: GeneralConfig):
         config.model_name = config.model_name or DEFAULT_MODEL
@@ -112,6 +137,7 @@ class GeminiTTSProvider(BaseTTSProvider):
             else DEFAULT_TEMPERATURE
         )
         self.temperature = max(0.0, min(1.0, float(config.gemini_temperature)))
+        self._concurrency = self._resolve_concurrency(config.gemini_concurrency)
 
         api_key = config.gemini_api_key or os.environ.get("GOOGLE_API_KEY")
         if not api_key:
@@ -119,15 +145,20 @@ class GeminiTTSProvider(BaseTTSProvider):
                 "GeminiTTSProvider: GOOGLE_API_KEY environment variable or --gemini_api_key is required."
             )
 
-        self.client = genai.Client(api_key=api_key)
+        self.client = _get_shared_client(os.getpid(), api_key, self._concurrency)
 
         super().__init__(config)
 
+        # Per-chapter constants, built once instead of for every chunk request.
+        instructions = (config.instructions or "").strip()
+        self._prompt_prefix = f"{instructions}\n\n" if instructions else ""
+        self._generate_config = self._build_generate_config()
+
     def __str__(self) -> str:
         return (
             f"GeminiTTSProvider(model={self.config.model_name}, voice={self.config.voice_name}, "
             f"output_format={self.config.output_format}, sample_rate={self.sample_rate}, channels={self.channels}, "
-            f"temperature={self.temperature})"
+            f"temperature={self.temperature}, concurrency={self._concurrency})"
         )
 
     def validate_config(self):
@@ -146,14 +177,14 @@ class GeminiTTSProvider(BaseTTSProvider):
         if self.config.voice_name and self.config.voice_name not in _SUPPORTED_VOICES:
             raise ValueError(
                 f"GeminiTTS: Unsupported voice name: {self.config.voice_name}. "
-                f"Supported voices: {_SUPPORTED_VOICES}"
+                f"Supported voices: {list(_SUPPORTED_VOICES_TUPLE)}"
             )
 
         for speaker, voice in self._speaker_map.items():
             if voice not in _SUPPORTED_VOICES:
                 raise ValueError(
                     f"GeminiTTS: Unsupported voice name '{voice}' for speaker '{speaker}'. "
-                    f"Supported voices: {_SUPPORTED_VOICES}"
+                    f"Supported voices: {list(_SUPPORTED_VOICES_TUPLE)}"
                 )
 
     def text_to_speech(self, text: str, output_file: str, audio_tags: AudioTags):
@@ -162,36 +193,24 @@ class GeminiTTSProvider(BaseTTSProvider):
             return
 
         chunks = split_text(text, self._max_chars, self.config.language)
-        audio_segments: List[io.BytesIO] = []
-        chunk_ids: List[str] = []
-
-        for index, chunk in enumerate(chunks, 1):
-            chunk_id = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_{index}_of_{len(chunks)}"
-            logger.info("GeminiTTS: Processing %s (length=%s)", chunk_id, len(chunk))
-            prepared_prompt = self._prepare_prompt(chunk)
+        chunk_ids: List[str] = [
+            f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_{index}_of_{len(chunks)}"
+            for index in range(1, len(chunks) + 1)
+        ]
+
+        # Chunks are independent API calls; keep several in flight and collect
+        # the results in submission order so the merged audio stays in sequence.
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            futures = [
+                executor.submit(self._synthesize_chunk, chunk, chunk_id)
+                for chunk, chunk_id in zip(chunks, chunk_ids)
+            ]
+            pcm_segments: List[bytes] = [future.result() for future in futures]
 
-            try:
-                response = self.client.models.generate_content(
-                    model=self.config.model_name,
-                    contents=prepared_prompt,
-                    config=self._build_generate_config(),
-                )
-            except Exception as exc:  # pragma: no cover - network call
-                logger.exception("GeminiTTS: API call failed for %s", chunk_id)
-                raise exc
-
-            pcm_bytes = self._extract_pcm_bytes(response, chunk_id)
-            segment_buffer = self._encode_pcm_to_segment(pcm_bytes)
-            audio_segments.append(segment_buffer)
-            chunk_ids.append(chunk_id)
-
-        merge_audio_segments(
-            audio_segments,
-            output_file,
-            self.get_output_file_extension(),
-            chunk_ids,
-            True,  # Gemini payloads require re-encoding; force pydub merge
-        )
+        # Every chunk is raw PCM in the same format, so the chapter is written
+        # once instead of encoding each chunk and merging them through pydub.
+        logger.info("GeminiTTS: Writing %s chunks to %s", len(pcm_segments), output_file)
+        self._write_pcm_segments(pcm_segments, output_file)
 
         set_audio_tags(output_file, audio_tags)
 
@@ -234,41 +253,86 @@ class GeminiTTSProvider(BaseTTSProvider):
             )
         )
 
+    def _synthesize_chunk(self, chunk: str, chunk_id: str) -> bytes:
+        logger.info("GeminiTTS: Processing %s (length=%s)", chunk_id, len(chunk))
+        prepared_prompt = self._prepare_prompt(chunk)
+
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                response = self.client.models.generate_content(
+                    model=self.config.model_name,
+                    contents=prepared_prompt,
+                    config=self._generate_config,
+                )
+                break
+            except Exception as exc:  # pragma: no cover - network call
+                if getattr(exc, "code", None) == 429 and attempt < MAX_RETRIES:
+                    logger.warning(
+                        "GeminiTTS: Rate limited on %s (attempt %s/%s), retrying",
+                        chunk_id,
+                        attempt,
+                        MAX_RETRIES,
+                    )
+                    time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+                    continue
+                logger.exception("GeminiTTS: API call failed for %s", chunk_id)
+                raise exc
+
+        return self._extract_pcm_bytes(response, chunk_id)
+
     def _prepare_prompt(self, chunk: str) -> str:
-        cleaned = chunk.replace(self.get_break_string(), "\n\n")
-        if self.config.instructions:
-            return f"{self.config.instructions.strip()}\n\n{cleaned}"
-        return cleaned
+        # The break marker has to survive split_text (which rejoins sentences
+        # with spaces), so it is only turned into a paragraph break here.
+        return self._prompt_prefix + chunk.replace(DEFAULT_BREAK_STRING, "\n\n")
 
     def _extract_pcm_bytes(self, response, chunk_id: str) -> bytes:
-        for candidate in getattr(response, "candidates", []):
+        # Typical responses carry one candidate with one inline audio part; only
+        # walk the whole structure when that shape is not there.
+        try:
+            data = response.candidates[0].content.parts[0].inline_data.data
+        except (AttributeError, IndexError, TypeError):
+            data = None
+        if data:
+            return self._decode_inline_data(data, chunk_id)
+
+        for candidate in getattr(response, "candidates", None) or []:
             content = getattr(candidate, "content", None)
             if not content:
                 continue
-            for part in getattr(content, "parts", []):
+            for part in getattr(content, "parts", None) or []:
                 inline = getattr(part, "inline_data", None)
                 if inline and getattr(inline, "data", None):
-                    data = inline.data
-                    if isinstance(data, str):
-                        try:
-                            return base64.b64decode(data)
-                        except Exception as exc:  # pragma: no cover - defensive decode
-                            logger.error("GeminiTTS: Failed to decode base64 audio for %s: %s", chunk_id, exc)
-                            raise
-                    return data
+                    return self._decode_inline_data(inline.data, chunk_id)
         raise RuntimeError(f"GeminiTTS: No audio payload returned for {chunk_id}")
 
-    def _encode_pcm_to_segment(self, pcm_bytes: bytes) -> io.BytesIO:
+    @staticmethod
+    def _decode_inline_data(data, chunk_id: str) -> bytes:
+        if isinstance(data, (bytes, bytearray)):
+            return data
+        try:
+            return binascii.a2b_base64(data)
+        except (binascii.Error, ValueError) as exc:  # pragma: no cover - defensive decode
+            logger.error("GeminiTTS: Failed to decode base64 audio for %s: %s", chunk_id, exc)
+            raise
+
+    def _write_pcm_segments(self, pcm_segments: List[bytes], output_file: str):
+        if self.get_output_file_extension() == "wav":
+            # WAV is just a RIFF header over the PCM frames: no decode, no ffmpeg.
+            with wave.open(output_file, "wb") as wav_file:
+                wav_file.setnchannels(self.channels)
+                wav_file.setsampwidth(self.sample_width)
+                wav_file.setframerate(self.sample_rate)
+                for pcm_bytes in pcm_segments:
+                    wav_file.writeframesraw(pcm_bytes)
+            return
+
         audio = AudioSegment(
-            data=pcm_bytes,
+            data=b"".join(pcm_segments),
             sample_width=self.sample_width,
             frame_rate=self.sample_rate,
             channels=self.channels,
         )
-        buffer = io.BytesIO()
-        audio.export(buffer, format=self.get_output_file_extension())
-        buffer.seek(0)
-        return buffer
+        audio.export(output_file, format=self.get_output_file_extension())
 
     @staticmethod
     def _parse_speaker_map(raw: Optional[str]) -> Dict[str, str]:
@@ -287,6 +351,16 @@ class GeminiTTSProvider(BaseTTSProvider):
             raise ValueError("GeminiTTS: speaker map must be a JSON object")
         return {str(key): str(value) for key, value in mapping.items()}
 
+    @staticmethod
+    def _resolve_concurrency(raw_concurrency: Optional[int]) -> int:
+        try:
+            concurrency = int(raw_concurrency) if raw_concurrency is not None else DEFAULT_CONCURRENCY
+            if concurrency <= 0:
+                raise ValueError
+            return concurrency
+        except (ValueError, TypeError):
+            return DEFAULT_CONCURRENCY
+
     @staticmethod
     def _resolve_sample_width(encoding: str) -> int:
         if encoding not in _SUPPORTED_ENCODINGS:
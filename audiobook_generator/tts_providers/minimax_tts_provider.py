@@ -1,24 +1,28 @@
 import io
 import logging
-import math
 import os
 import time
-from typing import List, Optional
-
-import requests
-
-try:
-    import fal_client  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    fal_client = None
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.tts_providers.base_tts_provider import BaseTTSProvider
+from audiobook_generator.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_retry_delay,
+    is_retryable,
+)
+from audiobook_generator.utils.shared_resources import get_shared_executor, get_shared_session, warm_up_session
+from audiobook_generator.utils.tts_cache import ChunkCache, get_chunk_cache_dir, get_chunk_cache_max_bytes
 from audiobook_generator.utils.utils import (
+    iter_future_results,
     merge_audio_segments,
     set_audio_tags,
     split_text,
+    wave_merge_audio_segments,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,8 +33,19 @@ DEFAULT_OUTPUT_FORMAT = "mp3"
 DEFAULT_BREAK_STRING = " @BRK#"
 DEFAULT_MAX_INPUT_CHARS = 4500  # Conservative limit (API max is 5000)
 DEFAULT_TIMEOUT_SECONDS = 60
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+FAL_RUN_URL = "https://fal.run"
+SYNC_RUN_TIMEOUT_SECONDS = 300
+# Host the generated audio is downloaded from (fal's media CDN). It is connected
+# to in the background while the first request is synthesized, so the first
+# download skips DNS/TLS setup.
+WARMUP_URL = "https://v3.fal.media"
+DEFAULT_CONCURRENCY = 8
 MAX_RETRIES = 4
 RETRY_BACKOFF_SECONDS = 2
+# Consecutive chunks that used up their retries; never below 2x the concurrency,
+# so one wave of failing in-flight chunks alone cannot open the breaker.
+CIRCUIT_BREAKER_THRESHOLD = 16
 # MiniMax pricing: Estimated at $0.015 per 1000 characters (placeholder - adjust based on actual pricing)
 USD_PER_1000_CHAR = 0.015
 
@@ -39,6 +54,7 @@ _SUPPORTED_VOICES = [
     "Chinese (Mandarin)_Sincere_Adult",
     "Chinese (Mandarin)_Soft_Girl",
 ]
+_SUPPORTED_VOICES_SET = frozenset(_SUPPORTED_VOICES)
 
 _SUPPORTED_LANGUAGE_BOOSTS = [
     "Chinese",
@@ -80,6 +96,7 @@ _SUPPORTED_LANGUAGE_BOOSTS = [
     "Afrikaans",
     "auto",
 ]
+_SUPPORTED_LANGUAGE_BOOSTS_SET = frozenset(_SUPPORTED_LANGUAGE_BOOSTS)
 
 _LANGUAGE_BOOST_MAPPING = {
     "zh": "Chinese",
@@ -125,12 +142,14 @@ _LANGUAGE_BOOST_MAPPING = {
 }
 
 
-def get_minimax_supported_voices() -> List[str]:
-    return list(_SUPPORTED_VOICES)
+@lru_cache(maxsize=None)
+def get_minimax_supported_voices() -> Tuple[str, ...]:
+    return tuple(_SUPPORTED_VOICES)
 
 
-def get_minimax_supported_language_boosts() -> List[str]:
-    return list(_SUPPORTED_LANGUAGE_BOOSTS)
+@lru_cache(maxsize=None)
+def get_minimax_supported_language_boosts() -> Tuple[str, ...]:
+    return tuple(_SUPPORTED_LANGUAGE_BOOSTS)
 
 
 class MinimaxTTSProvider(BaseTTSProvider):
@@ -148,8 +167,13 @@ class MinimaxTTSProvider(BaseTTSProvider):
             config.language,
         )
         self._timeout = self._resolve_timeout(config.minimax_request_timeout)
+        self._concurrency = self._resolve_concurrency(config.minimax_concurrency)
+        self._session = get_shared_session(self._concurrency)
+        self._breaker = CircuitBreaker(max(CIRCUIT_BREAKER_THRESHOLD, 2 * self._concurrency))
+        self._cache = ChunkCache(get_chunk_cache_dir(config), config.output_format, get_chunk_cache_max_bytes(config))
         self.price = USD_PER_1000_CHAR
         self._max_chars = DEFAULT_MAX_INPUT_CHARS
+        self._skip_normalization = bool(getattr(config, "skip_audio_normalization", False))
 
         self._api_key = config.minimax_api_key or os.environ.get("FAL_KEY")
         if not self._api_key:
@@ -157,29 +181,39 @@ class MinimaxTTSProvider(BaseTTSProvider):
                 "MinimaxTTSProvider: FAL_KEY environment variable or --minimax_api_key is required."
             )
 
-        if fal_client is None:
-            raise ImportError(
-                "MinimaxTTSProvider: fal-client is required. Install it via 'pip install fal-client'."
-            )
+        self._use_queue = bool(config.minimax_use_queue)
+        if self._use_queue:
+            # Imported only when the queue is used, so the default sync path
+            # and the CLI never load fal-client and its HTTP stack.
+            try:
+                import fal_client  # type: ignore
+            except ImportError:  # pragma: no cover - optional dependency
+                raise ImportError(
+                    "MinimaxTTSProvider: fal-client is required for --minimax_use_queue. "
+                    "Install it via 'pip install fal-client'."
+                )
+            self._fal_client = fal_client
 
-        # Configure fal_client with API key
-        os.environ["FAL_KEY"] = self._api_key
+            # Configure fal_client with API key
+            os.environ["FAL_KEY"] = self._api_key
 
         super().__init__(config)
+        self._base_arguments = self._build_base_arguments()
 
     def __str__(self) -> str:
         return (
             f"MinimaxTTSProvider(model={self.config.model_name}, voice={self.config.voice_name}, "
             f"speed={self._speed}, volume={self._volume}, pitch={self._pitch}, "
-            f"language_boost={self._language_boost}, output_format={self.config.output_format})"
+            f"language_boost={self._language_boost}, output_format={self.config.output_format}, "
+            f"concurrency={self._concurrency})"
         )
 
     def validate_config(self):
-        if self.config.voice_name not in _SUPPORTED_VOICES:
+        if self.config.voice_name not in _SUPPORTED_VOICES_SET:
             raise ValueError(
                 f"MinimaxTTS: Unsupported voice '{self.config.voice_name}'. Supported voices: {_SUPPORTED_VOICES}"
             )
-        if self._language_boost and self._language_boost not in _SUPPORTED_LANGUAGE_BOOSTS:
+        if self._language_boost and self._language_boost not in _SUPPORTED_LANGUAGE_BOOSTS_SET:
             raise ValueError(
                 f"MinimaxTTS: Unsupported language boost '{self._language_boost}'. "
                 f"Supported options: {_SUPPORTED_LANGUAGE_BOOSTS}"
@@ -196,29 +230,51 @@ class MinimaxTTSProvider(BaseTTSProvider):
             return
 
         chunks = split_text(text, self._max_chars, self.config.language)
-        audio_segments: List[io.BytesIO] = []
-        chunk_ids: List[str] = []
-
-        for index, chunk in enumerate(chunks, 1):
-            chunk_id = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_{index}_of_{len(chunks)}"
-            logger.info("MinimaxTTS: Processing %s (length=%s)", chunk_id, len(chunk))
-            prepared_text = self._prepare_text(chunk)
-
-            segment = self._synthesize_with_retry(prepared_text, chunk_id)
-            audio_segments.append(segment)
-            chunk_ids.append(chunk_id)
-
-        merge_audio_segments(
-            audio_segments,
-            output_file,
-            self.get_output_file_extension(),
-            chunk_ids,
-            True,  # ensure audio data is normalized via pydub
-        )
+        # Only the index varies between chunk ids, so the rest is formatted once.
+        chunk_id_prefix = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_"
+        chunk_id_suffix = f"_of_{len(chunks)}"
+        chunk_ids: List[str] = [
+            f"{chunk_id_prefix}{index}{chunk_id_suffix}" for index in range(1, len(chunks) + 1)
+        ]
+
+        # Chunks are independent API calls; keep several in flight and collect
+        # the results in submission order so the merged audio stays in sequence.
+        executor = get_shared_executor(self._concurrency)
+        warm_up_session(self._session, WARMUP_URL)
+        # Identical chunks are synthesized once and their audio is reused at
+        # every position they occur.
+        pending: Dict[str, Future] = {}
+        futures: List[Future] = []
+        for chunk, chunk_id in zip(chunks, chunk_ids):
+            future = pending.get(chunk)
+            if future is None:
+                future = pending[chunk] = executor.submit(self._synthesize_chunk, chunk, chunk_id)
+            futures.append(future)
+
+        # Segments are written out in order as they complete, while later
+        # chunks are still in flight, instead of being collected first.
+        try:
+            audio_segments = iter_future_results(futures)
+            if self.config.output_format == "wav":
+                wave_merge_audio_segments(audio_segments, output_file)
+            else:
+                merge_audio_segments(
+                    audio_segments,
+                    output_file,
+                    self.get_output_file_extension(),
+                    chunk_ids,
+                    not self._skip_normalization,  # normalize via pydub unless opted out
+                )
+        except BaseException:
+            # Don't keep paying for chunks of a chapter that already failed.
+            for future in futures:
+                future.cancel()
+            raise
+
         set_audio_tags(output_file, audio_tags)
 
     def estimate_cost(self, total_chars: int) -> float:
-        return math.ceil(total_chars / 1000) * self.price
+        return ((total_chars + 999) // 1000) * self.price
 
     def get_break_string(self):
         return DEFAULT_BREAK_STRING
@@ -227,28 +283,65 @@ class MinimaxTTSProvider(BaseTTSProvider):
         return self.config.output_format
 
     def _prepare_text(self, text: str) -> str:
-        return text.replace(self.get_break_string(), "\n\n").strip()
+        # str.replace hands back the same object when there is no break marker,
+        # so clean text is only scanned, never copied.
+        return text.replace(DEFAULT_BREAK_STRING, "\n\n").strip()
+
+    def _synthesize_chunk(self, chunk: str, chunk_id: str) -> io.BytesIO:
+        logger.info("MinimaxTTS: Processing %s (length=%s)", chunk_id, len(chunk))
+        text = self._prepare_text(chunk)
+        cache_key = self._chunk_cache_key(text)
+        segment = self._cache.get(cache_key)
+        if segment is not None:
+            logger.debug("MinimaxTTS: Reusing cached audio for %s", chunk_id)
+            return segment
+        segment = self._synthesize_with_retry(text, chunk_id)
+        self._cache.put(cache_key, segment)
+        logger.info("MinimaxTTS: Finished %s", chunk_id)
+        return segment
+
+    def _chunk_cache_key(self, text: str) -> str:
+        return ChunkCache.make_key(
+            self.config.model_name,
+            self.config.voice_name,
+            self._speed,
+            self._volume,
+            self._pitch,
+            self._language_boost,
+            self.config.output_format,
+            text,
+        )
 
     def _synthesize_with_retry(self, text: str, chunk_id: str) -> io.BytesIO:
-        last_error: Optional[Exception] = None
+        if not self._breaker.allow_request():
+            raise CircuitOpenError(
+                f"MinimaxTTS: Skipping {chunk_id} after {self._breaker.threshold} consecutive failed chunks"
+            )
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                return self._synthesize(text)
+                segment = self._synthesize(text)
             except Exception as exc:  # pragma: no cover - network interaction
-                last_error = exc
+                if not is_retryable(exc):
+                    self._breaker.record_failure()
+                    logger.error("MinimaxTTS: Non-retryable error for %s: %s", chunk_id, exc)
+                    raise
+                if attempt == MAX_RETRIES:
+                    self._breaker.record_failure()
+                    logger.error("MinimaxTTS: Exhausted retries for %s", chunk_id)
+                    raise
+                delay = get_retry_delay(exc, attempt, RETRY_BACKOFF_SECONDS)
                 logger.warning(
-                    "MinimaxTTS: Attempt %s/%s failed for %s due to %s", attempt, MAX_RETRIES, chunk_id, exc
+                    "MinimaxTTS: Attempt %s/%s failed for %s due to %s; retrying in %.1fs",
+                    attempt, MAX_RETRIES, chunk_id, exc, delay,
                 )
-                if attempt < MAX_RETRIES:
-                    time.sleep(RETRY_BACKOFF_SECONDS * attempt)
-        logger.error("MinimaxTTS: Exhausted retries for %s", chunk_id)
-        if last_error:
-            raise last_error
+                time.sleep(delay)
+            else:
+                self._breaker.record_success()
+                return segment
         raise RuntimeError(f"MinimaxTTS: Failed to synthesize chunk {chunk_id}")
 
-    def _synthesize(self, text: str) -> io.BytesIO:
-        arguments = {
-            "text": text,
+    def _build_base_arguments(self) -> Dict[str, Any]:
+        arguments: Dict[str, Any] = {
             "voice_setting": {
                 "speed": self._speed,
                 "vol": self._volume,
@@ -261,30 +354,55 @@ class MinimaxTTSProvider(BaseTTSProvider):
 
         if self._language_boost:
             arguments["language_boost"] = self._language_boost
+        return arguments
+
+    def _synthesize(self, text: str) -> io.BytesIO:
+        # Only the text changes between chunks; the voice settings are shared.
+        arguments = {"text": text, **self._base_arguments}
 
         logger.debug("MinimaxTTS: Calling API with arguments: %s", arguments)
 
-        response = fal_client.subscribe(
-            self.config.model_name,
-            arguments=arguments,
-            with_logs=False,
-        )
+        if self._use_queue:
+            response = self._fal_client.subscribe(
+                self.config.model_name,
+                arguments=arguments,
+                with_logs=False,
+            )
+        else:
+            response = self._run_sync(arguments)
 
         audio_url = response.get("audio", {}).get("url")
         if not audio_url:
             raise RuntimeError("MinimaxTTS: Response did not contain an audio URL.")
 
         logger.debug("MinimaxTTS: Downloading audio from %s", audio_url)
-        audio_bytes = self._download_audio(audio_url)
-        buffer = io.BytesIO(audio_bytes)
+        return self._download_audio(audio_url)
+
+    def _run_sync(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        # A single synchronous POST to fal.run returns the result directly.
+        # fal_client.subscribe instead submits to the queue and polls it with
+        # sleeps, which adds dead time after every chunk finishes (the same
+        # SDK-overhead pattern Deepgram removed by switching to plain HTTP).
+        response = self._session.post(
+            f"{FAL_RUN_URL}/{self.config.model_name}",
+            json=arguments,
+            headers={"Authorization": f"Key {self._api_key}"},
+            timeout=(self._timeout, SYNC_RUN_TIMEOUT_SECONDS),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _download_audio(self, url: str) -> io.BytesIO:
+        # Stream the body straight into the buffer that is handed to the merge
+        # step instead of holding it once as bytes and again as a BytesIO copy.
+        buffer = io.BytesIO()
+        with self._session.get(url, timeout=self._timeout, stream=True) as response:
+            response.raise_for_status()
+            for block in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(block)
         buffer.seek(0)
         return buffer
 
-    def _download_audio(self, url: str) -> bytes:
-        response = requests.get(url, timeout=self._timeout)
-        response.raise_for_status()
-        return response.content
-
     @staticmethod
     def _resolve_speed(raw_speed: Optional[float]) -> float:
         """Resolve speed parameter (default: 1.0, range typically 0.5-2.0)"""
@@ -328,6 +446,16 @@ class MinimaxTTSProvider(BaseTTSProvider):
         except (ValueError, TypeError):
             return DEFAULT_TIMEOUT_SECONDS
 
+    @staticmethod
+    def _resolve_concurrency(raw_concurrency: Optional[int]) -> int:
+        try:
+            concurrency = int(raw_concurrency) if raw_concurrency is not None else DEFAULT_CONCURRENCY
+            if concurrency <= 0:
+                raise ValueError
+            return concurrency
+        except (ValueError, TypeError):
+            return DEFAULT_CONCURRENCY
+
     @staticmethod
     def _resolve_language_boost(explicit: Optional[str], locale: Optional[str]) -> Optional[str]:
         """Resolve language_boost from explicit setting or locale"""
@@ -3,9 +3,16 @@ import logging
 import math
 import tempfile
 import os
+from functools import lru_cache
+from typing import Optional
 from pydub import AudioSegment
 
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
+
+try:
+    import h2  # type: ignore  # noqa: F401  # enables HTTP/2 in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
 
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.config.general_config import GeneralConfig
@@ -46,6 +53,14 @@ def get_price(model):
         return 0.0
 
 
+@lru_cache(maxsize=None)
+def _get_shared_client(pid: int, api_key: Optional[str]) -> OpenAI:
+    # A provider is built per chapter, so the client (and its keep-alive
+    # connection pool) is shared for the whole process instead. Keyed by pid so
+    # forked chapter workers never reuse connections opened by their parent.
+    return OpenAI(api_key=api_key, max_retries=4, http_client=DefaultHttpxClient(http2=h2 is not None))
+
+
 class OpenAITTSProvider(BaseTTSProvider):
     def __init__(self, config: GeneralConfig):
         config.model_name = config.model_name or "gpt-4o-mini-tts" # default to this model as it's the cheapest
@@ -57,7 +72,8 @@ class OpenAITTSProvider(BaseTTSProvider):
         self.price = get_price(config.model_name)
         super().__init__(config)
 
-        self.client = OpenAI(max_retries=4)  # User should set OPENAI_API_KEY environment variable
+        # User should set OPENAI_API_KEY environment variable
+        self.client = _get_shared_client(os.getpid(), os.environ.get("OPENAI_API_KEY"))
 
     def __str__(self) -> str:
         return super().__str__()
@@ -1,22 +1,30 @@
-import base64
+import binascii
 import io
 import logging
-import math
 import os
+import struct
+import sys
 import time
-from typing import Dict, List, Optional
-
-import requests
-try:
-    import dashscope  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    dashscope = None
+import wave
+from concurrent.futures import Future
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.tts_providers.base_tts_provider import BaseTTSProvider
+from audiobook_generator.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    TTSRequestError,
+    get_retry_delay,
+    is_retryable,
+)
+from audiobook_generator.utils.shared_resources import get_shared_executor, get_shared_session
+from audiobook_generator.utils.tts_cache import ChunkCache, get_chunk_cache_dir, get_chunk_cache_max_bytes
 from audiobook_generator.utils.utils import (
-    merge_audio_segments,
+    iter_future_results,
     set_audio_tags,
     split_text,
 )
@@ -30,8 +38,18 @@ DEFAULT_LANGUAGE_TYPE = "Chinese"
 DEFAULT_BREAK_STRING = " @BRK#"
 DEFAULT_MAX_INPUT_CHARS = 550
 DEFAULT_TIMEOUT_SECONDS = 30
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Qwen3 TTS returns 24 kHz, 16-bit, mono PCM: raw in streaming mode and inside
+# a WAV container when downloaded from the result URL.
+PCM_SAMPLE_RATE = 24000
+PCM_CHANNELS = 1
+PCM_SAMPLE_WIDTH = 2
+DEFAULT_CONCURRENCY = 4
 MAX_RETRIES = 4
 RETRY_BACKOFF_SECONDS = 2
+# Consecutive chunks that used up their retries; never below 2x the concurrency,
+# so one wave of failing in-flight chunks alone cannot open the breaker.
+CIRCUIT_BREAKER_THRESHOLD = 16
 # Aliyun pricing: 0.8 RMB per 10,000 characters.
 # Approximate conversion to USD using 1 RMB ≈ 0.14 USD (2025-09 w/ buffer).
 USD_PER_1000_CHAR = 0.0112
@@ -40,6 +58,7 @@ _SUPPORTED_MODELS = [
     "qwen3-tts-flash",
     "qwen3-tts-flash-2025-09-18",
 ]
+_SUPPORTED_MODELS_SET = frozenset(_SUPPORTED_MODELS)
 
 _SUPPORTED_VOICES = [
     "Cherry",
@@ -60,6 +79,7 @@ _SUPPORTED_VOICES = [
     "Kiki",
     "Eric",
 ]
+_SUPPORTED_VOICES_SET = frozenset(_SUPPORTED_VOICES)
 
 _SUPPORTED_LANGUAGE_TYPES = [
     "Chinese",
@@ -73,6 +93,7 @@ _SUPPORTED_LANGUAGE_TYPES = [
     "German",
     "Portuguese",
 ]
+_SUPPORTED_LANGUAGE_TYPES_SET = frozenset(_SUPPORTED_LANGUAGE_TYPES)
 
 _LANGUAGE_ALIAS: Dict[str, str] = {
     "zh": "Chinese",
@@ -101,16 +122,19 @@ _LANGUAGE_ALIAS: Dict[str, str] = {
 }
 
 
-def get_qwen_supported_models() -> List[str]:
-    return list(_SUPPORTED_MODELS)
+@lru_cache(maxsize=None)
+def get_qwen_supported_models() -> Tuple[str, ...]:
+    return tuple(_SUPPORTED_MODELS)
 
 
-def get_qwen_supported_voices() -> List[str]:
-    return list(_SUPPORTED_VOICES)
+@lru_cache(maxsize=None)
+def get_qwen_supported_voices() -> Tuple[str, ...]:
+    return tuple(_SUPPORTED_VOICES)
 
 
-def get_qwen_supported_language_types() -> List[str]:
-    return list(_SUPPORTED_LANGUAGE_TYPES)
+@lru_cache(maxsize=None)
+def get_qwen_supported_language_types() -> Tuple[str, ...]:
+    return tuple(_SUPPORTED_LANGUAGE_TYPES)
 
 
 class Qwen3TTSProvider(BaseTTSProvider):
@@ -128,6 +152,10 @@ class Qwen3TTSProvider(BaseTTSProvider):
         if self._stream:
             logger.warning("Qwen3TTSProvider: Streaming mode enabled; collected audio will be reassembled locally.")
         self._timeout = self._resolve_timeout(config.qwen_request_timeout)
+        self._concurrency = self._resolve_concurrency(config.qwen_concurrency)
+        self._session = get_shared_session(self._concurrency)
+        self._breaker = CircuitBreaker(max(CIRCUIT_BREAKER_THRESHOLD, 2 * self._concurrency))
+        self._cache = ChunkCache(get_chunk_cache_dir(config), "pcm", get_chunk_cache_max_bytes(config))
         self.price = USD_PER_1000_CHAR
         self._max_chars = DEFAULT_MAX_INPUT_CHARS
 
@@ -137,29 +165,35 @@ class Qwen3TTSProvider(BaseTTSProvider):
                 "Qwen3TTSProvider: DASHSCOPE_API_KEY environment variable or --qwen_api_key is required."
             )
 
-        if dashscope is None:
+        # The SDK is imported here rather than at module level, so listing the
+        # Qwen3 choices for the CLI does not load dashscope and its HTTP stack.
+        try:
+            import dashscope  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
             raise ImportError(
                 "Qwen3TTSProvider: dashscope>=1.24.6 is required. Install it via 'pip install dashscope>=1.24.6'."
             )
+        self._dashscope = dashscope
 
         super().__init__(config)
 
     def __str__(self) -> str:
         return (
             f"Qwen3TTSProvider(model={self.config.model_name}, voice={self.config.voice_name}, "
-            f"language_type={self._language_type}, stream={self._stream}, output_format={self.config.output_format})"
+            f"language_type={self._language_type}, stream={self._stream}, output_format={self.config.output_format}, "
+            f"concurrency={self._concurrency})"
         )
 
     def validate_config(self):
-        if self.config.model_name not in _SUPPORTED_MODELS:
+        if self.config.model_name not in _SUPPORTED_MODELS_SET:
             raise ValueError(
                 f"Qwen3TTS: Unsupported model '{self.config.model_name}'. Supported models: {_SUPPORTED_MODELS}"
             )
-        if self.config.voice_name not in _SUPPORTED_VOICES:
+        if self.config.voice_name not in _SUPPORTED_VOICES_SET:
             raise ValueError(
                 f"Qwen3TTS: Unsupported voice '{self.config.voice_name}'. Supported voices: {_SUPPORTED_VOICES}"
             )
-        if self._language_type not in _SUPPORTED_LANGUAGE_TYPES:
+        if self._language_type not in _SUPPORTED_LANGUAGE_TYPES_SET:
             raise ValueError(
                 f"Qwen3TTS: Unsupported language type '{self._language_type}'. Supported types: {_SUPPORTED_LANGUAGE_TYPES}"
             )
@@ -174,29 +208,40 @@ class Qwen3TTSProvider(BaseTTSProvider):
             return
 
         chunks = split_text(text, self._max_chars, self.config.language)
-        audio_segments: List[io.BytesIO] = []
-        chunk_ids: List[str] = []
-
-        for index, chunk in enumerate(chunks, 1):
-            chunk_id = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_{index}_of_{len(chunks)}"
-            logger.info("Qwen3TTS: Processing %s (length=%s)", chunk_id, len(chunk))
-            prepared_text = self._prepare_text(chunk)
-
-            segment = self._synthesize_with_retry(prepared_text, chunk_id)
-            audio_segments.append(segment)
-            chunk_ids.append(chunk_id)
-
-        merge_audio_segments(
-            audio_segments,
-            output_file,
-            self.get_output_file_extension(),
-            chunk_ids,
-            True,  # ensure wav data is normalized via pydub
-        )
+        # Only the index varies between chunk ids, so the rest is formatted once.
+        chunk_id_prefix = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_"
+        chunk_id_suffix = f"_of_{len(chunks)}"
+        chunk_ids: List[str] = [
+            f"{chunk_id_prefix}{index}{chunk_id_suffix}" for index in range(1, len(chunks) + 1)
+        ]
+
+        # Chunks are independent API calls; keep several in flight and collect
+        # the results in submission order so the merged audio stays in sequence.
+        executor = get_shared_executor(self._concurrency)
+        # Identical chunks are synthesized once and their audio is reused at
+        # every position they occur.
+        pending: Dict[str, Future] = {}
+        futures: List[Future] = []
+        for chunk, chunk_id in zip(chunks, chunk_ids):
+            future = pending.get(chunk)
+            if future is None:
+                future = pending[chunk] = executor.submit(self._synthesize_chunk, chunk, chunk_id)
+            futures.append(future)
+
+        # Segments are written out in order as they complete, while later
+        # chunks are still in flight, instead of being collected first.
+        try:
+            self._write_pcm_segments(iter_future_results(futures), output_file)
+        except BaseException:
+            # Don't keep paying for chunks of a chapter that already failed.
+            for future in futures:
+                future.cancel()
+            raise
+
         set_audio_tags(output_file, audio_tags)
 
     def estimate_cost(self, total_chars: int) -> float:
-        return math.ceil(total_chars / 1000) * self.price
+        return ((total_chars + 999) // 1000) * self.price
 
     def get_break_string(self):
         return DEFAULT_BREAK_STRING
@@ -205,23 +250,58 @@ class Qwen3TTSProvider(BaseTTSProvider):
         return self.config.output_format
 
     def _prepare_text(self, text: str) -> str:
-        return text.replace(self.get_break_string(), "\n\n").strip()
+        # str.replace hands back the same object when there is no break marker,
+        # so clean text is only scanned, never copied.
+        return text.replace(DEFAULT_BREAK_STRING, "\n\n").strip()
+
+    def _synthesize_chunk(self, chunk: str, chunk_id: str) -> io.BytesIO:
+        logger.info("Qwen3TTS: Processing %s (length=%s)", chunk_id, len(chunk))
+        text = self._prepare_text(chunk)
+        cache_key = self._chunk_cache_key(text)
+        segment = self._cache.get(cache_key)
+        if segment is not None:
+            logger.debug("Qwen3TTS: Reusing cached audio for %s", chunk_id)
+            return segment
+        segment = self._synthesize_with_retry(text, chunk_id)
+        self._cache.put(cache_key, segment)
+        logger.info("Qwen3TTS: Finished %s", chunk_id)
+        return segment
+
+    def _chunk_cache_key(self, text: str) -> str:
+        return ChunkCache.make_key(
+            self.config.model_name,
+            self.config.voice_name,
+            self._language_type,
+            self.config.output_format,
+            text,
+        )
 
     def _synthesize_with_retry(self, text: str, chunk_id: str) -> io.BytesIO:
-        last_error: Optional[Exception] = None
+        if not self._breaker.allow_request():
+            raise CircuitOpenError(
+                f"Qwen3TTS: Skipping {chunk_id} after {self._breaker.threshold} consecutive failed chunks"
+            )
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                return self._synthesize(text)
+                segment = self._synthesize(text)
             except Exception as exc:  # pragma: no cover - network interaction
-                last_error = exc
+                if not is_retryable(exc):
+                    self._breaker.record_failure()
+                    logger.error("Qwen3TTS: Non-retryable error for %s: %s", chunk_id, exc)
+                    raise
+                if attempt == MAX_RETRIES:
+                    self._breaker.record_failure()
+                    logger.error("Qwen3TTS: Exhausted retries for %s", chunk_id)
+                    raise
+                delay = get_retry_delay(exc, attempt, RETRY_BACKOFF_SECONDS)
                 logger.warning(
-                    "Qwen3TTS: Attempt %s/%s failed for %s due to %s", attempt, MAX_RETRIES, chunk_id, exc
+                    "Qwen3TTS: Attempt %s/%s failed for %s due to %s; retrying in %.1fs",
+                    attempt, MAX_RETRIES, chunk_id, exc, delay,
                 )
-                if attempt < MAX_RETRIES:
-                    time.sleep(RETRY_BACKOFF_SECONDS * attempt)
-        logger.error("Qwen3TTS: Exhausted retries for %s", chunk_id)
-        if last_error:
-            raise last_error
+                time.sleep(delay)
+            else:
+                self._breaker.record_success()
+                return segment
         raise RuntimeError(f"Qwen3TTS: Failed to synthesize chunk {chunk_id}")
 
     def _synthesize(self, text: str) -> io.BytesIO:
@@ -230,7 +310,7 @@ class Qwen3TTSProvider(BaseTTSProvider):
         return self._synthesize_non_streaming(text)
 
     def _synthesize_non_streaming(self, text: str) -> io.BytesIO:
-        response = dashscope.MultiModalConversation.call(
+        response = self._dashscope.MultiModalConversation.call(
             model=self.config.model_name,
             api_key=self._api_key,
             text=text,
@@ -238,20 +318,18 @@ class Qwen3TTSProvider(BaseTTSProvider):
             language_type=self._language_type,
             stream=False,
         )
+        self._check_response(response)
         audio_url = getattr(response.output.audio, "url", None)
         if not audio_url:
             raise RuntimeError("Qwen3TTS: Response did not contain an audio URL.")
 
         logger.debug("Qwen3TTS: Downloading audio from %s", audio_url)
-        audio_bytes = self._download_audio(audio_url)
-        buffer = io.BytesIO(audio_bytes)
-        buffer.seek(0)
-        return buffer
+        return self._download_pcm(audio_url)
 
     def _synthesize_streaming(self, text: str) -> io.BytesIO:
-        buffer = io.BytesIO()
+        b64_parts: List[str] = []
         audio_url: Optional[str] = None
-        for chunk in dashscope.MultiModalConversation.call(
+        for chunk in self._dashscope.MultiModalConversation.call(
             model=self.config.model_name,
             api_key=self._api_key,
             text=text,
@@ -259,27 +337,106 @@ class Qwen3TTSProvider(BaseTTSProvider):
             language_type=self._language_type,
             stream=True,
         ):
+            self._check_response(chunk)
             audio = getattr(chunk.output, "audio", None)
             if not audio:
                 continue
             if getattr(audio, "data", None):
-                buffer.write(base64.b64decode(audio.data))
+                b64_parts.append(audio.data)
             if getattr(audio, "url", None):
                 audio_url = audio.url
 
-        if buffer.tell() == 0:
+        if not b64_parts:
             if not audio_url:
                 raise RuntimeError("Qwen3TTS: Streaming response contained no audio data.")
             logger.debug("Qwen3TTS: Streaming fallback download from %s", audio_url)
-            buffer = io.BytesIO(self._download_audio(audio_url))
+            return self._download_pcm(audio_url)
+
+        return io.BytesIO(self._decode_streamed_audio(b64_parts))
+
+    @staticmethod
+    def _check_response(response) -> None:
+        # DashScope reports failures through the response status instead of
+        # raising, so surface them as errors the retry policy can classify.
+        status_code = getattr(response, "status_code", HTTPStatus.OK)
+        if status_code != HTTPStatus.OK:
+            raise TTSRequestError(
+                f"Qwen3TTS: Request failed with status {status_code}: {getattr(response, 'message', '')}",
+                int(status_code),
+            )
 
-        buffer.seek(0)
-        return buffer
+    @staticmethod
+    def _decode_streamed_audio(b64_parts: List[str]) -> bytes:
+        # Decode the whole stream in one call: parts may split the encoded text
+        # at any offset. a2b_base64 stops at the first padding, though, so when
+        # a part before the last is padded (each part encoded on its own) the
+        # parts are decoded one by one instead.
+        if not any("=" in part for part in b64_parts[:-1]):
+            joined = "".join(b64_parts)
+            return binascii.a2b_base64(joined + "=" * (-len(joined) % 4))
+        return b"".join(binascii.a2b_base64(part) for part in b64_parts)
+
+    def _download_pcm(self, url: str) -> io.BytesIO:
+        # The WAV header is parsed as the first blocks arrive and only the PCM
+        # frames are kept, so every chunk ends up in the same raw format as
+        # streamed audio and the chapter is written with a single header.
+        pcm = io.BytesIO()
+        header = b""
+        remaining: Optional[int] = None
+        with self._session.get(url, timeout=self._timeout, stream=True) as response:
+            response.raise_for_status()
+            for block in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if remaining is None:
+                    header += block
+                    data_chunk = self._find_wav_data_chunk(header)
+                    if data_chunk is None:
+                        continue
+                    data_offset, remaining = data_chunk
+                    block, header = header[data_offset:], b""
+                if remaining > 0:
+                    block = block[:remaining]
+                    pcm.write(block)
+                    remaining -= len(block)
+        if remaining is None:
+            raise RuntimeError("Qwen3TTS: Downloaded audio has no WAV data chunk.")
+        pcm.seek(0)
+        return pcm
+
+    @staticmethod
+    def _find_wav_data_chunk(header: bytes) -> Optional[Tuple[int, int]]:
+        """Return (offset, size) of the PCM frames, or None if more bytes are needed."""
+        if len(header) < 12:
+            return None
+        if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            raise RuntimeError("Qwen3TTS: Downloaded audio is not a WAV file.")
+        offset = 12
+        while len(header) >= offset + 8:
+            chunk_id = header[offset:offset + 4]
+            size = int.from_bytes(header[offset + 4:offset + 8], "little")
+            if chunk_id == b"data":
+                # Streamed WAVs leave the size at 0 or 0xFFFFFFFF: read to the end.
+                if size in (0, 0xFFFFFFFF):
+                    size = sys.maxsize
+                return offset + 8, size
+            if chunk_id == b"fmt ":
+                if len(header) < offset + 24:
+                    return None
+                _, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", header, offset + 8)
+                if (channels, rate, bits) != (PCM_CHANNELS, PCM_SAMPLE_RATE, PCM_SAMPLE_WIDTH * 8):
+                    raise RuntimeError(
+                        f"Qwen3TTS: Unexpected audio format ({channels} ch, {rate} Hz, {bits} bit)."
+                    )
+            offset += 8 + size + (size & 1)
+        return None
 
-    def _download_audio(self, url: str) -> bytes:
-        response = requests.get(url, timeout=self._timeout)
-        response.raise_for_status()
-        return response.content
+    @staticmethod
+    def _write_pcm_segments(pcm_segments: Iterable[io.BytesIO], output_file: str) -> None:
+        with wave.open(output_file, "wb") as wav_file:
+            wav_file.setnchannels(PCM_CHANNELS)
+            wav_file.setsampwidth(PCM_SAMPLE_WIDTH)
+            wav_file.setframerate(PCM_SAMPLE_RATE)
+            for segment in pcm_segments:
+                wav_file.writeframesraw(segment.getbuffer())
 
     @staticmethod
     def _resolve_timeout(raw_timeout: Optional[int]) -> int:
@@ -291,6 +448,16 @@ class Qwen3TTSProvider(BaseTTSProvider):
         except Exception:
             return DEFAULT_TIMEOUT_SECONDS
 
+    @staticmethod
+    def _resolve_concurrency(raw_concurrency: Optional[int]) -> int:
+        try:
+            concurrency = int(raw_concurrency) if raw_concurrency is not None else DEFAULT_CONCURRENCY
+            if concurrency <= 0:
+                raise ValueError
+            return concurrency
+        except (ValueError, TypeError):
+            return DEFAULT_CONCURRENCY
+
     @staticmethod
     def _resolve_language_type(explicit: Optional[str], locale: Optional[str]) -> str:
         if explicit:
@@ -298,4 +465,4 @@ class Qwen3TTSProvider(BaseTTSProvider):
         if not locale:
             return DEFAULT_LANGUAGE_TYPE
         normalized = locale.lower()
-        return _LANGUAGE_ALIAS.get(normalized, DEFAULT_LANGUAGE_TYPE)
\ No newline at end of file
+        return _LANGUAGE_ALIAS.get(normalized, DEFAULT_LANGUAGE_TYPE)
@@ -1,7 +1,14 @@
 import logging
 import datetime
+import os
+from functools import lru_cache
 from pathlib import Path
 
+# Target (log file, worker formatting) and handlers installed by the last
+# setup_logging call, so repeated calls for the same target are a no-op.
+_configured_target = None
+_configured_handlers = ()
+
 def get_formatter(is_worker):
     if is_worker:
         return logging.Formatter(
@@ -13,20 +20,30 @@ def get_formatter(is_worker):
         )
 
 def setup_logging(log_level, log_file=None, is_worker=False):
-    formatter = get_formatter(is_worker)
+    global _configured_target, _configured_handlers
 
     root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+
+    if not log_file:
+        log_file = generate_unique_log_path("app") # Default prefix "app"
+
+    # Repeated main() calls (web UI runs, tests) log to the same file: keep the
+    # open handlers instead of reopening the file on every call.
+    target = (os.path.abspath(log_file), is_worker)
+    if target == _configured_target and all(h in root_logger.handlers for h in _configured_handlers):
+        return
+
+    formatter = get_formatter(is_worker)
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-    root_logger.setLevel(log_level)
+        if handler in _configured_handlers:
+            handler.close()
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
-    if not log_file:
-        log_file = generate_unique_log_path("app") # Default prefix "app"
-
     # Ensure the directory for the log file exists
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
@@ -34,8 +51,16 @@ def setup_logging(log_level, log_file=None, is_worker=False):
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
 
+    _configured_target = target
+    _configured_handlers = (console_handler, file_handler)
+
 def generate_unique_log_path(prefix: str) -> Path:
     """Generates a unique log file path with a timestamp."""
+    return _generate_log_path(prefix, os.getpid())
+
+@lru_cache(maxsize=None)
+def _generate_log_path(prefix: str, pid: int) -> Path:
+    # Memoized per process: one log file per prefix for the process lifetime.
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     log_dir = Path("logs")
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,108 @@
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS = 30
+CIRCUIT_RESET_SECONDS = 60
+
+
+class TTSRequestError(RuntimeError):
+    """A TTS API call that failed with an HTTP-style status code."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API once too many calls failed in a row."""
+
+
+class CircuitBreaker:
+    """
+    Counts consecutive chunks that failed after using up their retries, across
+    all chunk workers of a provider. Once the threshold is reached further
+    chunks fail immediately, so a dead or rejecting service is not hammered by
+    the rest of the chapter. Transient errors that a retry recovers from are
+    never counted.
+
+    After reset_seconds the breaker is half-open: one chunk is let through as
+    a trial, and its success closes the breaker again.
+    """
+
+    def __init__(self, threshold: int, reset_seconds: float = CIRCUIT_RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._failures >= self.threshold
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._failures < self.threshold:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_seconds:
+                # Half-open: admit one trial and hold the rest for another period.
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+def get_status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status carried by an SDK or requests exception, if any."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Client errors other than timeouts and rate limits will fail again."""
+    status = get_status_code(exc)
+    return status is None or status in (408, 429) or status >= 500
+
+
+def get_retry_delay(exc: BaseException, attempt: int, base_seconds: float) -> float:
+    """
+    Exponential backoff with jitter for the given (1-based) attempt.
+    Server errors back off twice as long, and a rate limit's Retry-After
+    header is honoured (up to MAX_BACKOFF_SECONDS) when the service sends one.
+    """
+    status = get_status_code(exc)
+    if status == 429:
+        retry_after = _get_retry_after(exc)
+        if retry_after is not None:
+            return min(MAX_BACKOFF_SECONDS, retry_after)
+    delay = base_seconds * (2 ** (attempt - 1))
+    if status is not None and status >= 500:
+        delay *= 2
+    return min(MAX_BACKOFF_SECONDS, delay) * (0.5 + random.random())
+
+
+def _get_retry_after(exc: BaseException) -> Optional[float]:
+    headers = getattr(exc, "response_headers", None) or getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after") or headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,94 @@
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TIMEOUT_SECONDS = 5
+
+# Providers are constructed once per chapter, so the HTTP session and the chunk
+# worker pool live at module level to be reused for the whole process instead
+# of being rebuilt (and re-handshaking) for every chapter.
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_warmed_up: Set[str] = set()
+
+
+def get_shared_session(pool_size: int) -> requests.Session:
+    """Return the process-wide keep-alive session, creating it on first use."""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _build_session(pool_size)
+        return _session
+
+
+def warm_up_session(session: requests.Session, url: str) -> None:
+    """
+    Open a connection to url in the background, once per process, so the first
+    real download skips DNS and TLS setup.
+
+    Call it where the session is about to be used (text_to_speech), not when a
+    provider is built: the parent builds one only for the cost estimate and
+    then forks the chapter workers, which must not inherit a running thread.
+    """
+    with _lock:
+        if url in _warmed_up:
+            return
+        _warmed_up.add(url)
+    threading.Thread(target=_warm_up, args=(session, url), name="tts-session-warmup", daemon=True).start()
+
+
+def get_shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the process-wide chunk worker pool, sized on first use."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-chunk")
+        return _executor
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    # Retries are handled by the providers' own retry policy.
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _warm_up(session: requests.Session, url: str) -> None:
+    try:
+        session.head(url, timeout=WARMUP_TIMEOUT_SECONDS)
+    except requests.RequestException as e:
+        logger.debug(f"Connection warm-up to {url} failed: {e}")
+
+
+def _reset_after_fork() -> None:
+    # Chapter workers are forked: sockets copied from the parent must not be
+    # shared between processes, and the parent's pool threads do not exist in
+    # the child, so each child starts with fresh resources.
+    global _lock, _session, _executor, _warmed_up
+    _lock = threading.Lock()
+    _session = None
+    _executor = None
+    _warmed_up = set()
+
+
+def _shutdown() -> None:
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    if _session is not None:
+        _session.close()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(_shutdown)
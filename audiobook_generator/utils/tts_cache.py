@@ -0,0 +1,152 @@
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = ".tts_cache"
+DEFAULT_CACHE_SIZE_MB = 1024
+TMP_SUFFIX = ".tmp"
+
+
+def get_chunk_cache_dir(config) -> Optional[str]:
+    """
+    Resolve where synthesized chunks are cached for this run.
+
+    Returns None when caching is disabled or there is no output folder to
+    place the default cache directory in.
+    """
+    if getattr(config, "no_tts_cache", False):
+        return None
+    if getattr(config, "tts_cache_dir", None):
+        return config.tts_cache_dir
+    if getattr(config, "output_folder", None):
+        return os.path.join(config.output_folder, CACHE_DIR_NAME)
+    return None
+
+
+def get_chunk_cache_max_bytes(config) -> Optional[int]:
+    """Size cap of the chunk cache in bytes, or None for an unbounded cache."""
+    size_mb = getattr(config, "tts_cache_size_mb", None)
+    if size_mb is None:
+        size_mb = DEFAULT_CACHE_SIZE_MB
+    return size_mb * 1024 * 1024 if size_mb > 0 else None
+
+
+class ChunkCache:
+    """
+    Disk cache of synthesized audio chunks, keyed by a hash of everything that
+    affects the audio (text, model, voice and voice parameters).
+
+    Re-running a book after editing one chapter then only pays for the chunks
+    that actually changed. A cache created with cache_dir=None is a no-op.
+
+    When max_bytes is set the cache is evicted least recently used first: a hit
+    refreshes the entry's mtime, and once a write takes the directory over the
+    cap the oldest entries are removed until it fits again.
+    """
+
+    def __init__(self, cache_dir: Optional[str], extension: str, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.extension = extension
+        self.max_bytes = max_bytes
+        # Measured on the first write, so constructing a provider or a
+        # cache-hit-only run never has to stat the whole directory.
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        # Unit separator keeps ("ab", "c") and ("a", "bc") from colliding.
+        return hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[io.BytesIO]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as cached:
+                audio = io.BytesIO(cached.read())
+        except FileNotFoundError:
+            return None
+        if self.max_bytes:
+            try:
+                os.utime(path)
+            except OSError:
+                pass  # Evicted by another worker in the meantime.
+        return audio
+
+    def put(self, key: str, audio: io.BytesIO) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            # Created on first write, so a --preview run leaves no cache directory.
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file and rename it into place, so concurrent
+            # workers or an interrupted run never leave a truncated entry behind.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=TMP_SUFFIX)
+        except OSError as e:
+            logger.warning(f"Failed to create TTS cache directory {self.cache_dir}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(audio.getbuffer())
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        if self.max_bytes:
+            with self._lock:
+                if self._size is None:
+                    # The scan already includes the entry just written.
+                    self._size = self._measure()
+                else:
+                    self._size += audio.getbuffer().nbytes
+                if self._size > self.max_bytes:
+                    self._evict()
+
+    def _evict(self) -> None:
+        # Other workers write to the same directory, so rescan it instead of
+        # trusting the running total, then drop the least recently used entries.
+        entries = []
+        for entry in self._scan():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        self._size = sum(size for _, size, _ in entries)
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+            removed += 1
+        logger.debug(f"Evicted {removed} TTS cache entries, cache size is now {self._size} bytes")
+
+    def _measure(self) -> int:
+        size = 0
+        for entry in self._scan():
+            try:
+                size += entry.stat().st_size
+            except FileNotFoundError:
+                pass  # Evicted by another worker in the meantime.
+        return size
+
+    def _scan(self):
+        with os.scandir(self.cache_dir) as entries:
+            return [entry for entry in entries if entry.is_file() and not entry.name.endswith(TMP_SUFFIX)]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{self.extension}")
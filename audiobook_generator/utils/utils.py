@@ -1,5 +1,7 @@
 import logging
-from typing import List
+import wave
+from concurrent.futures import Future
+from typing import Iterable, Iterator, List, MutableSequence
 import tempfile
 import os
 import io
@@ -12,6 +14,8 @@ import os
 
 logger = logging.getLogger(__name__)
 
+PART_SUFFIX = ".part"
+
 
 def split_text(text: str, max_chars: int, language: str) -> List[str]:
     """
@@ -30,6 +34,12 @@ def split_text(text: str, max_chars: int, language: str) -> List[str]:
         return []
     if max_chars <= 0:
         raise ValueError("max_chars must be positive")
+
+    # Text that already fits in one chunk needs no sentence boundaries, so the
+    # segmenter (by far the dominant cost of splitting) is skipped entirely.
+    stripped = text.strip()
+    if len(stripped) <= max_chars:
+        return [stripped] if stripped else []
     
     # Use sentencex to get all sentences
     sentences = list(segment(language, text))
@@ -229,33 +239,152 @@ def pydub_merge_audio_segments(tmp_files: List[str], output_file: str, output_fo
     logger.debug(f"Temporary files deleted: {tmp_files}")
 
 
-def direct_merge_audio_segments(audio_segments: List[io.BytesIO], output_file: str) -> None:
+# Layer III bitrates (kbps) by bitrate index, and sample rates by version bits.
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def strip_mp3_headers(data: memoryview) -> memoryview:
+    """
+    Skip a leading ID3v2 tag and a leading Xing/Info/VBRI header frame.
+
+    Every synthesized MP3 chunk carries its own; concatenated as-is, the copies
+    after the first end up mid-stream and players read the first chunk's frame
+    count as the duration of the whole file. The tags are written afterwards by
+    set_audio_tags, and the header frame is silent, so nothing audible is lost.
+    """
+    offset = 0
+    if len(data) >= 10 and data[:3] == b"ID3":
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        offset = 10 + size + (10 if data[5] & 0x10 else 0)  # footer flag
+    frame_length = _mp3_info_frame_length(data, offset)
+    return data[offset + frame_length:]
+
+
+def _mp3_info_frame_length(data: memoryview, offset: int) -> int:
+    """Length of the MPEG Layer III frame at offset if it is a VBR/Info header frame, else 0."""
+    if len(data) < offset + 40 or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return 0
+    version = (data[offset + 1] >> 3) & 0x03
+    layer = (data[offset + 1] >> 1) & 0x03
+    bitrate_index = data[offset + 2] >> 4
+    sample_rate_index = (data[offset + 2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return 0
+    mono = data[offset + 3] >> 6 == 3
+    if version == 3:
+        bitrate = _MP3_BITRATES_V1[bitrate_index]
+        side_info = 17 if mono else 32
+        coefficient = 144
+    else:
+        bitrate = _MP3_BITRATES_V2[bitrate_index]
+        side_info = 9 if mono else 17
+        coefficient = 72
+    tag_offset = offset + 4 + side_info
+    if data[tag_offset:tag_offset + 4] not in (b"Xing", b"Info") and data[offset + 36:offset + 40] != b"VBRI":
+        return 0
+    padding = (data[offset + 2] >> 1) & 0x01
+    return coefficient * bitrate * 1000 // _MP3_SAMPLE_RATES[version][sample_rate_index] + padding
+
+
+def direct_merge_audio_segments(audio_segments: Iterable[io.BytesIO], output_file: str,
+                                output_format: str = None) -> None:
     """
     Directly write multiple audio segments into one file without using pydub
     
     Args:
-        audio_segments: List of audio segments in memory
+        audio_segments: Audio segments in memory, in order
         output_file: Path to the final output file
+        output_format: Audio file format; per-chunk MP3 headers are dropped for "mp3"
     """
-    if not audio_segments:
+    # Chunks are written to a ".part" file that only replaces output_file once
+    # every chunk succeeded, so a failed chapter never leaves a truncated but
+    # playable file behind.
+    part_file = output_file + PART_SUFFIX
+    outfile = None
+    try:
+        for segment in audio_segments:
+            if outfile is None:
+                logger.debug(f"Writing audio segments directly to file: {output_file}")
+                outfile = open(part_file, "wb")
+            buffer = segment.getbuffer()
+            if output_format == "mp3":
+                buffer = strip_mp3_headers(buffer)
+            outfile.write(buffer)
+    except BaseException:
+        if outfile is not None:
+            outfile.close()
+            _remove_part_file(part_file)
+        raise
+    if outfile is None:
         logger.warning("No audio segments to write")
         return
-        
-    logger.debug(f"Writing audio segments directly to file: {output_file}")
-    with open(output_file, "wb") as outfile:
+    outfile.close()
+    os.replace(part_file, output_file)
+    logger.debug(f"Direct writing completed: {output_file}")
+
+
+def wave_merge_audio_segments(audio_segments: Iterable[io.BytesIO], output_file: str) -> None:
+    """
+    Merge WAV segments into one file with the wave module, copying PCM frames
+    without decoding. The header is written once and patched on close.
+    All segments must share channels, sample width and frame rate.
+    
+    Args:
+        audio_segments: Iterable of WAV audio segments in memory
+        output_file: Path to the final output file
+    """
+    part_file = output_file + PART_SUFFIX  # See direct_merge_audio_segments
+    writer = None
+    try:
         for segment in audio_segments:
             segment.seek(0)
-            outfile.write(segment.read())
-    logger.debug(f"Direct writing completed: {output_file}")
+            with wave.open(segment, "rb") as reader:
+                params = reader.getparams()
+                if writer is None:
+                    logger.debug(f"Writing WAV segments to file: {output_file}")
+                    writer = wave.open(part_file, "wb")
+                    writer.setparams(params)
+                elif params[:3] != writer.getparams()[:3]:
+                    raise ValueError(f"WAV segment format {params[:3]} does not match {writer.getparams()[:3]}")
+                writer.writeframesraw(reader.readframes(params.nframes))
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            _remove_part_file(part_file)
+        raise
+    if writer is None:
+        logger.warning("No audio segments to write")
+        return
+    writer.close()
+    os.replace(part_file, output_file)
+
+
+def _remove_part_file(part_file: str) -> None:
+    try:
+        os.remove(part_file)
+    except OSError as e:
+        logger.warning(f"Failed to remove partial output file {part_file}: {e}")
+
+
+def iter_future_results(futures: MutableSequence[Future]) -> Iterator:
+    """
+    Yield the results of futures in sequence order, dropping each future once
+    it is consumed so its result can be freed as soon as it has been written.
+    """
+    futures.reverse()
+    while futures:
+        yield futures.pop().result()
 
 
-def merge_audio_segments(audio_segments: List[io.BytesIO], output_file: str, output_format: str, 
+def merge_audio_segments(audio_segments: Iterable[io.BytesIO], output_file: str, output_format: str, 
                           chunk_ids: List[str], use_pydub_merge: bool) -> None:
     """
     Merge audio segments using either pydub or direct write method based on configuration
     
     Args:
-        audio_segments: List of audio segments (BytesIO objects)
+        audio_segments: Audio segments (BytesIO objects), in order
         output_file: Path to the final output file
         output_format: Audio file format
         chunk_ids: List of IDs for each audio chunk
@@ -273,4 +402,4 @@ def merge_audio_segments(audio_segments: List[io.BytesIO], output_file: str, out
     else:
         logger.info(f"Using direct write to merge audio segments: {chunk_ids}")
         # Direct write audio segments to output file
-        direct_merge_audio_segments(audio_segments, output_file)
\ No newline at end of file
+        direct_merge_audio_segments(audio_segments, output_file, output_format)
\ No newline at end of file
@@ -1,31 +1,72 @@
 import argparse
-from pathlib import Path
+from functools import lru_cache
 
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audiobook_generator import AudiobookGenerator
 from audiobook_generator.tts_providers.base_tts_provider import (
     get_supported_tts_providers,
 )
-from audiobook_generator.tts_providers.qwen_tts_provider import (
-    get_qwen_supported_language_types,
-    get_qwen_supported_models,
-    get_qwen_supported_voices,
-)
-from audiobook_generator.tts_providers.minimax_tts_provider import (
-    get_minimax_supported_voices,
-    get_minimax_supported_language_boosts,
-)
 from audiobook_generator.utils.log_handler import setup_logging, generate_unique_log_path
 
 
-def handle_args():
-    parser = argparse.ArgumentParser(description="Convert text book to audiobook")
+class _FrozenChoices:
+    """
+    argparse choices backed by a frozenset for constant-time validation,
+    iterating in the original order so help and error messages are unchanged.
+    """
+
+    def __init__(self, choices):
+        self._choices = tuple(choices)
+        self._members = frozenset(self._choices)
+
+    def __contains__(self, value):
+        return value in self._members
+
+    def __iter__(self):
+        return iter(self._choices)
+
+    def __len__(self):
+        return len(self._choices)
+
+    def __getitem__(self, index):
+        return self._choices[index]
+
+    def __repr__(self):
+        return repr(list(self._choices))
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # Parsing does not mutate the parser, so it is built once and reused by
+    # every handle_args() call (tests and UI re-invocations included).
+    # The provider modules are imported here, not at module level, so importing
+    # main (e.g. from the web UI or tests) does not load them.
+    from audiobook_generator.tts_providers.minimax_tts_provider import (
+        get_minimax_supported_language_boosts,
+        get_minimax_supported_voices,
+    )
+    from audiobook_generator.tts_providers.qwen_tts_provider import (
+        get_qwen_supported_language_types,
+        get_qwen_supported_models,
+        get_qwen_supported_voices,
+    )
+
+    tts_providers = _FrozenChoices(get_supported_tts_providers())
+    qwen_language_types = _FrozenChoices(get_qwen_supported_language_types())
+    qwen_models = _FrozenChoices(get_qwen_supported_models())
+    qwen_voices = _FrozenChoices(get_qwen_supported_voices())
+    minimax_language_boosts = _FrozenChoices(get_minimax_supported_language_boosts())
+    minimax_voices = _FrozenChoices(get_minimax_supported_voices())
+
+    # Options are always spelled out in full, so skip argparse's prefix scan
+    # over every option string for unrecognised arguments.
+    parser = argparse.ArgumentParser(description="Convert text book to audiobook", allow_abbrev=False)
     parser.add_argument("input_file", help="Path to the EPUB file")
     parser.add_argument("output_folder", help="Path to the output folder")
     parser.add_argument(
         "--tts",
-        choices=get_supported_tts_providers(),
-        default=get_supported_tts_providers()[0],
+        choices=tts_providers,
+        default=tts_providers[0],
            help="Choose TTS provider (default: azure). azure: Azure Cognitive Services, openai: OpenAI TTS API, edge: Microsoft Edge voices, gemini: Google Gemini 2.5 Pro Preview TTS, qwen3: Alibaba Qwen3 TTS, minimax: MiniMax Speech-02 HD, piper: Piper local/Docker voices. When using azure, environment variables MS_TTS_KEY and MS_TTS_REGION must be set. When using openai, environment variable OPENAI_API_KEY must be set. When using gemini, environment variable GOOGLE_API_KEY must be set unless --gemini_api_key is provided. When using qwen3, environment variable DASHSCOPE_API_KEY must be set unless --qwen_api_key is provided. When using minimax, environment variable FAL_KEY must be set unless --minimax_api_key is provided.",
     )
     parser.add_argument(
@@ -102,9 +143,9 @@ def handle_args():
     parser.add_argument(
         "--worker_count",
         type=int,
-        default=1,
         help="Specifies the number of parallel workers to use for audiobook generation. "
         "Increasing this value can significantly speed up the process by processing multiple chapters simultaneously. "
+        "Default: one per CPU core (up to the number of chapters) for local Piper, 1 for all other TTS providers. "
         "Note: Chapters may not be processed in sequential order, but this will not affect the final audiobook.",
     )
 
@@ -120,6 +161,34 @@ def handle_args():
         "Only use this option if you encounter issues with direct write.",
     )
 
+    parser.add_argument(
+        "--skip_audio_normalization",
+        action="store_true",
+        help="Write MiniMax MP3 chunks of one chapter back to back instead of normalizing them through pydub. "
+        "This saves an ffmpeg decode and re-encode of the whole chapter, and is safe when all chunks come from "
+        "the same voice and parameters. WAV output is always merged without re-encoding.",
+    )
+
+    parser.add_argument(
+        "--tts_cache_dir",
+        help="Directory where synthesized audio chunks are cached, so re-running a book only sends changed text to the TTS service. "
+        "Currently used by Qwen3 and MiniMax TTS. Default: <output_folder>/.tts_cache",
+    )
+
+    parser.add_argument(
+        "--tts_cache_size_mb",
+        type=int,
+        default=1024,
+        help="Maximum size of the TTS chunk cache in MiB. Least recently used chunks are evicted once it is exceeded. "
+        "0 disables the limit. Default: 1024",
+    )
+
+    parser.add_argument(
+        "--no_tts_cache",
+        action="store_true",
+        help="Disable the synthesized audio chunk cache and always call the TTS service.",
+    )
+
     parser.add_argument(
         "--voice_name",
         help="Various TTS providers has different voice names, look up for your provider settings.",
@@ -244,6 +313,12 @@ def handle_args():
         default=0.2,
         help="Sampling temperature for Gemini TTS (0.0-1.0). Lower values sound more consistent. Default: 0.2",
     )
+    gemini_tts_group.add_argument(
+        "--gemini_concurrency",
+        type=int,
+        default=4,
+        help="Number of text chunks sent to Gemini TTS concurrently within a chapter (default: 4). Lower it if you hit rate limits.",
+    )
 
     qwen_tts_group = parser.add_argument_group(title="qwen3 specific")
     qwen_tts_group.add_argument(
@@ -252,7 +327,7 @@ def handle_args():
     )
     qwen_tts_group.add_argument(
         "--qwen_language_type",
-        choices=get_qwen_supported_language_types(),
+        choices=qwen_language_types,
         help="Language type parameter accepted by Qwen3 TTS (e.g. Chinese, English).",
     )
     qwen_tts_group.add_argument(
@@ -265,16 +340,22 @@ def handle_args():
         type=int,
         help="Timeout in seconds for downloading Qwen audio URLs (default: 30).",
     )
+    qwen_tts_group.add_argument(
+        "--qwen_concurrency",
+        type=int,
+        default=4,
+        help="Number of text chunks sent to Qwen3 TTS concurrently within a chapter (default: 4). Lower it if you hit rate limits.",
+    )
     qwen_tts_group.add_argument(
         "--qwen_model",
         dest="model_name",
-        choices=get_qwen_supported_models(),
+        choices=qwen_models,
         help="Model name for Qwen3 TTS (alias of --model_name).",
     )
     qwen_tts_group.add_argument(
         "--qwen_voice",
         dest="voice_name",
-        choices=get_qwen_supported_voices(),
+        choices=qwen_voices,
         help="Voice name for Qwen3 TTS (alias of --voice_name).",
     )
 
@@ -303,7 +384,7 @@ def handle_args():
     )
     minimax_tts_group.add_argument(
         "--minimax_language_boost",
-        choices=get_minimax_supported_language_boosts(),
+        choices=minimax_language_boosts,
         help="Language boost for MiniMax TTS to enhance recognition of specified languages.",
     )
     minimax_tts_group.add_argument(
@@ -311,14 +392,29 @@ def handle_args():
         type=int,
         help="Timeout in seconds for downloading MiniMax audio URLs (default: 60).",
     )
+    minimax_tts_group.add_argument(
+        "--minimax_concurrency",
+        type=int,
+        default=8,
+        help="Number of text chunks sent to MiniMax TTS concurrently within a chapter (default: 8). Lower it if you hit rate limits.",
+    )
+    minimax_tts_group.add_argument(
+        "--minimax_use_queue",
+        action="store_true",
+        help="Submit MiniMax requests through fal's queue API (requires fal-client) instead of a direct synchronous HTTP call.",
+    )
     minimax_tts_group.add_argument(
         "--minimax_voice",
         dest="voice_name",
-        choices=get_minimax_supported_voices(),
+        choices=minimax_voices,
         help="Voice name for MiniMax TTS (alias of --voice_name).",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def handle_args():
+    args = _build_parser().parse_args()
     return GeneralConfig(args)
 
 
@@ -327,18 +423,18 @@ def main(config=None, log_file=None):
         config = handle_args()
 
     if log_file:
-        # If log_file is provided (e.g., from UI), use it directly as a Path object.
+        # If log_file is provided (e.g., from UI), use it directly.
         # The UI passes an absolute path string.
-        effective_log_file = Path(log_file)
+        effective_log_file = log_file if isinstance(log_file, str) else str(log_file)
     else:
         # Otherwise (e.g., CLI usage without a specific log file from UI),
         # generate a unique log file name.
-        effective_log_file = generate_unique_log_path("EtA")
+        effective_log_file = str(generate_unique_log_path("EtA"))
     
     # Ensure config.log_file is updated, as it's used by AudiobookGenerator for worker processes.
     config.log_file = effective_log_file
 
-    setup_logging(config.log, str(effective_log_file))
+    setup_logging(config.log, effective_log_file)
 
     AudiobookGenerator(config).run()
 
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from audiobook_generator.book_parsers.base_book_parser import get_book_parser
@@ -30,6 +32,64 @@ class TestMarkdownBookParser(unittest.TestCase):
         self.assertNotIn("**", first_chapter_text)
         self.assertNotIn("[link]", first_chapter_text)
 
+    def test_invalid_newline_mode(self):
+        self.config.newline_mode = "triple"
+        with self.assertRaises(ValueError):
+            get_book_parser(self.config)
+
+    def test_iter_chapters(self):
+        chapters = self.parser.iter_chapters(" @BRK#")
+        self.assertEqual(next(chapters)[0], "Prologue")
+        self.assertEqual(
+            [("Prologue", self.parser.get_chapters(" @BRK#")[0][1])] + list(chapters),
+            self.parser.get_chapters(" @BRK#"),
+        )
+
+    def test_search_and_replaces(self):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False, newline=""
+        ) as fp:
+            fp.write("# comment==ignored\r\nbold==strong\r\nopening==first")
+        self.addCleanup(os.remove, fp.name)
+        self.config.search_and_replace_file = fp.name
+        parser = get_book_parser(self.config)
+
+        replaces = [(pattern.pattern, replace) for pattern, replace in parser.get_search_and_replaces()]
+        self.assertEqual(replaces, [("bold", "strong"), ("opening", "first")])
+
+        first_chapter_text = parser.get_chapters(" @BRK#")[0][1]
+        self.assertIn("the first section with strong text", first_chapter_text)
+
+    def test_no_break_at_chapter_edges(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False) as fp:
+            fp.write("```\ncode\n```\n- item\n- other\n\n```\nmore code\n```\n")
+        self.addCleanup(os.remove, fp.name)
+        self.config.input_file = fp.name
+        self.config.newline_mode = "single"
+        parser = get_book_parser(self.config)
+        self.assertEqual(parser.get_chapters(" @BRK#")[0][1], "item @BRK# other")
+
+    def test_edge_breaks_keep_real_punctuation(self):
+        # Piper's break string is ".", which also ends ordinary sentences.
+        with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False) as fp:
+            fp.write(".NET began.\n\nThe end...\n")
+        self.addCleanup(os.remove, fp.name)
+        self.config.input_file = fp.name
+        self.config.newline_mode = "double"
+        parser = get_book_parser(self.config)
+        self.assertEqual(parser.get_chapters(".")[0][1], ".NET began. . The end...")
+
+    def test_no_break_left_by_removed_paragraph(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False) as fp:
+            fp.write("[2]\n\nFirst.\n  \n> \n>\nSecond.\n\n[1]\n")
+        self.addCleanup(os.remove, fp.name)
+        self.config.input_file = fp.name
+        self.config.newline_mode = "double"
+        self.config.remove_reference_numbers = True
+        parser = get_book_parser(self.config)
+        self.assertEqual(parser.get_chapters(" @BRK#")[0][1], "First. @BRK# Second.")
+        self.assertEqual(parser.get_chapters(".")[0][1], "First. . Second.")
+
 
 if __name__ == '__main__':
     unittest.main()
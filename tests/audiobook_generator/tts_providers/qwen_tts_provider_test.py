@@ -0,0 +1,123 @@
+import base64
+import struct
+import unittest
+from types import SimpleNamespace
+
+from audiobook_generator.tts_providers.qwen_tts_provider import (
+    PCM_CHANNELS,
+    PCM_SAMPLE_RATE,
+    PCM_SAMPLE_WIDTH,
+    Qwen3TTSProvider,
+)
+
+PCM = bytes(range(256)) * 600  # 150 KiB of frames, more than one 64 KiB block
+
+
+def make_wav(pcm: bytes, data_size=None, extra_chunks: bytes = b"", trailing: bytes = b"") -> bytes:
+    fmt = struct.pack(
+        "<HHIIHH",
+        1,
+        PCM_CHANNELS,
+        PCM_SAMPLE_RATE,
+        PCM_SAMPLE_RATE * PCM_CHANNELS * PCM_SAMPLE_WIDTH,
+        PCM_CHANNELS * PCM_SAMPLE_WIDTH,
+        PCM_SAMPLE_WIDTH * 8,
+    )
+    size = len(pcm) if data_size is None else data_size
+    body = (
+        b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + extra_chunks
+        + b"data" + struct.pack("<I", size) + pcm
+        + trailing
+    )
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+class FakeResponse:
+    def __init__(self, payload: bytes, block_size: int):
+        self.payload = payload
+        self.block_size = block_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.payload), self.block_size):
+            yield self.payload[start:start + self.block_size]
+
+
+def download(payload: bytes, block_size: int) -> bytes:
+    provider = Qwen3TTSProvider.__new__(Qwen3TTSProvider)
+    provider._timeout = 1
+    provider._session = SimpleNamespace(get=lambda url, **kwargs: FakeResponse(payload, block_size))
+    return provider._download_pcm("https://example.com/audio.wav").read()
+
+
+class TestQwen3DownloadPcm(unittest.TestCase):
+    def test_block_sizes(self):
+        for block_size in (1, 7, 64 * 1024):
+            with self.subTest(block_size=block_size):
+                self.assertEqual(download(make_wav(PCM[:4096]), block_size), PCM[:4096])
+        self.assertEqual(download(make_wav(PCM), 64 * 1024), PCM)
+
+    def test_list_chunk_before_data(self):
+        # Odd-sized chunks are padded to an even length.
+        info = b"INFOISFT" + struct.pack("<I", 5) + b"Lavf\x00"
+        list_chunk = b"LIST" + struct.pack("<I", len(info)) + info + b"\x00"
+        for block_size in (1, 64 * 1024):
+            with self.subTest(block_size=block_size):
+                self.assertEqual(download(make_wav(PCM, extra_chunks=list_chunk), block_size), PCM)
+
+    def test_trailing_bytes_are_dropped(self):
+        trailing = b"id3 " + struct.pack("<I", 4) + b"junk"
+        for block_size in (1, 64 * 1024):
+            with self.subTest(block_size=block_size):
+                self.assertEqual(download(make_wav(PCM, trailing=trailing), block_size), PCM)
+
+    def test_unknown_data_size_reads_to_end(self):
+        for data_size in (0, 0xFFFFFFFF):
+            for block_size in (1, 64 * 1024):
+                with self.subTest(data_size=data_size, block_size=block_size):
+                    self.assertEqual(download(make_wav(PCM[:3000], data_size=data_size), block_size), PCM[:3000])
+
+    def test_rejects_other_formats(self):
+        with self.assertRaises(RuntimeError):
+            download(b"ID3\x04" + PCM[:100], 64 * 1024)
+        wav = bytearray(make_wav(PCM[:100]))
+        struct.pack_into("<I", wav, 24, 44100)  # sample rate field of the fmt chunk
+        with self.assertRaises(RuntimeError):
+            download(bytes(wav), 64 * 1024)
+        with self.assertRaises(RuntimeError):
+            download(make_wav(b"")[:30], 64 * 1024)
+
+
+class TestQwen3DecodeStreamedAudio(unittest.TestCase):
+    def test_aligned_parts(self):
+        parts = [base64.b64encode(PCM[i:i + 3000]).decode() for i in range(0, 9000, 3000)]
+        self.assertEqual(Qwen3TTSProvider._decode_streamed_audio(parts), PCM[:9000])
+
+    def test_unaligned_parts(self):
+        encoded = base64.b64encode(PCM[:1000]).decode()
+        parts = [encoded[:5], encoded[5:6], encoded[6:999], encoded[999:]]
+        self.assertEqual(Qwen3TTSProvider._decode_streamed_audio(parts), PCM[:1000])
+
+    def test_unpadded_last_part(self):
+        encoded = base64.b64encode(PCM[:1000]).decode().rstrip("=")
+        self.assertEqual(Qwen3TTSProvider._decode_streamed_audio([encoded[:400], encoded[400:]]), PCM[:1000])
+
+    def test_padded_parts(self):
+        chunks = [PCM[:1000], PCM[1000:2001], PCM[2001:2003]]
+        parts = [base64.b64encode(chunk).decode() for chunk in chunks]
+        self.assertTrue(parts[0].endswith("=") and parts[1].endswith("="))
+        self.assertEqual(Qwen3TTSProvider._decode_streamed_audio(parts), PCM[:2003])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import io
+import os
+import tempfile
+import unittest
+import wave
+from concurrent.futures import Future
+
+from audiobook_generator.utils.utils import (
+    direct_merge_audio_segments,
+    iter_future_results,
+    strip_mp3_headers,
+    wave_merge_audio_segments,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames.
+MP3_FRAME_HEADER = b"\xff\xfb\x90\x00"
+MP3_FRAME_LENGTH = 417
+
+
+def mp3_frame(fill: bytes) -> bytes:
+    return MP3_FRAME_HEADER + fill * (MP3_FRAME_LENGTH - 4)
+
+
+def mp3_chunk(audio: bytes) -> bytes:
+    id3 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"TAG.."
+    info = bytearray(mp3_frame(b"\x00"))
+    info[36:40] = b"Info"
+    return id3 + bytes(info) + audio
+
+
+class TestMp3Merge(unittest.TestCase):
+    def test_strip_headers(self):
+        audio = mp3_frame(b"\x01") + mp3_frame(b"\x02")
+        self.assertEqual(bytes(strip_mp3_headers(memoryview(mp3_chunk(audio)))), audio)
+
+    def test_plain_frames_are_kept(self):
+        audio = mp3_frame(b"\x01")
+        self.assertEqual(bytes(strip_mp3_headers(memoryview(audio))), audio)
+
+    def test_direct_merge_mp3(self):
+        first, second = mp3_frame(b"\x01"), mp3_frame(b"\x02")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "out.mp3")
+            segments = (io.BytesIO(mp3_chunk(audio)) for audio in (first, second))
+            direct_merge_audio_segments(segments, output_file, "mp3")
+            with open(output_file, "rb") as merged:
+                self.assertEqual(merged.read(), first + second)
+
+    def test_direct_merge_empty(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "out.mp3")
+            direct_merge_audio_segments(iter(()), output_file, "mp3")
+            self.assertFalse(os.path.exists(output_file))
+
+    def test_direct_merge_failure_leaves_no_file(self):
+        def segments():
+            yield io.BytesIO(mp3_frame(b"\x01"))
+            raise RuntimeError("chunk failed")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(RuntimeError):
+                direct_merge_audio_segments(segments(), os.path.join(tmp_dir, "out.mp3"), "mp3")
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+
+def wav_segment(frames: bytes, channels: int = 1, sample_width: int = 2, rate: int = 24000) -> io.BytesIO:
+    segment = io.BytesIO()
+    with wave.open(segment, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(rate)
+        writer.writeframes(frames)
+    segment.seek(0)
+    return segment
+
+
+class TestWaveMerge(unittest.TestCase):
+    def test_merge(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "out.wav")
+            wave_merge_audio_segments(iter([wav_segment(b"\x01\x00" * 10), wav_segment(b"\x02\x00" * 5)]), output_file)
+            with wave.open(output_file, "rb") as reader:
+                self.assertEqual(reader.getnframes(), 15)
+                self.assertEqual(reader.getframerate(), 24000)
+                self.assertEqual(reader.readframes(15), b"\x01\x00" * 10 + b"\x02\x00" * 5)
+
+    def test_mismatched_format(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "out.wav")
+            with self.assertRaises(ValueError):
+                wave_merge_audio_segments([wav_segment(b"\x00\x00"), wav_segment(b"\x00\x00", rate=16000)], output_file)
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_empty(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "out.wav")
+            wave_merge_audio_segments(iter(()), output_file)
+            self.assertFalse(os.path.exists(output_file))
+
+
+class TestIterFutureResults(unittest.TestCase):
+    def test_in_order_and_released(self):
+        futures = []
+        for value in ("a", "b", "a"):
+            future = Future()
+            future.set_result(value)
+            futures.append(future)
+        results = iter_future_results(futures)
+        self.assertEqual(next(results), "a")
+        self.assertEqual(len(futures), 2)
+        self.assertEqual(list(results), ["b", "a"])
+        self.assertEqual(futures, [])
+
+    def test_error_propagates(self):
+        future = Future()
+        future.set_exception(RuntimeError("boom"))
+        with self.assertRaises(RuntimeError):
+            list(iter_future_results([future]))
+
+
+if __name__ == "__main__":
+    unittest.main()
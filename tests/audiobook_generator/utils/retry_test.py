@@ -0,0 +1,59 @@
+import unittest
+from types import SimpleNamespace
+
+from audiobook_generator.utils.retry import (
+    CircuitBreaker,
+    TTSRequestError,
+    get_retry_delay,
+    get_status_code,
+    is_retryable,
+)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_status_code(self):
+        self.assertEqual(get_status_code(TTSRequestError("boom", 503)), 503)
+        error = RuntimeError("boom")
+        error.response = SimpleNamespace(status_code=404)
+        self.assertEqual(get_status_code(error), 404)
+        self.assertIsNone(get_status_code(ValueError("boom")))
+
+    def test_is_retryable(self):
+        self.assertTrue(is_retryable(ConnectionError("reset")))
+        self.assertTrue(is_retryable(TTSRequestError("slow down", 429)))
+        self.assertTrue(is_retryable(TTSRequestError("unavailable", 503)))
+        self.assertFalse(is_retryable(TTSRequestError("bad request", 400)))
+
+    def test_retry_delay(self):
+        for attempt in range(1, 5):
+            delay = get_retry_delay(ConnectionError(), attempt, 2)
+            self.assertGreaterEqual(delay, 2 ** attempt * 0.5)
+            self.assertLess(delay, 2 ** attempt * 1.5)
+        self.assertLess(get_retry_delay(ConnectionError(), 20, 2), 45)
+
+        error = TTSRequestError("slow down", 429)
+        error.response = SimpleNamespace(headers={"retry-after": "7"})
+        self.assertEqual(get_retry_delay(error, 1, 2), 7)
+        error.response.headers["retry-after"] = "3600"
+        self.assertEqual(get_retry_delay(error, 1, 2), 30)
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        self.assertFalse(breaker.allow_request())
+
+    def test_circuit_breaker_half_open(self):
+        breaker = CircuitBreaker(1, reset_seconds=0)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import io
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from audiobook_generator.utils.tts_cache import ChunkCache, get_chunk_cache_dir, get_chunk_cache_max_bytes
+
+
+class TestChunkCache(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ChunkCache(os.path.join(tmp_dir, "cache"), "mp3")
+            key = ChunkCache.make_key("model", "voice", 1.0, "Hello there.")
+            self.assertIsNone(cache.get(key))
+
+            cache.put(key, io.BytesIO(b"audio"))
+            self.assertEqual(cache.get(key).read(), b"audio")
+            self.assertEqual(os.listdir(os.path.join(tmp_dir, "cache")), [f"{key}.mp3"])
+
+    def test_key_depends_on_every_part(self):
+        self.assertNotEqual(ChunkCache.make_key("ab", "c"), ChunkCache.make_key("a", "bc"))
+        self.assertNotEqual(ChunkCache.make_key("voice", 1.0), ChunkCache.make_key("voice", 1.1))
+
+    def test_evicts_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ChunkCache(tmp_dir, "mp3", max_bytes=10)
+            cache.put("old", io.BytesIO(b"aaaa"))
+            cache.put("used", io.BytesIO(b"bbbb"))
+            os.utime(os.path.join(tmp_dir, "old.mp3"), (1, 1))
+            os.utime(os.path.join(tmp_dir, "used.mp3"), (2, 2))
+
+            cache.put("new", io.BytesIO(b"cccc"))
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(cache.get("used").read(), b"bbbb")
+            self.assertEqual(cache.get("new").read(), b"cccc")
+
+    def test_counts_existing_entries_on_first_put(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ChunkCache(tmp_dir, "mp3").put("old", io.BytesIO(b"aaaaaaaa"))
+            os.utime(os.path.join(tmp_dir, "old.mp3"), (1, 1))
+
+            cache = ChunkCache(tmp_dir, "mp3", max_bytes=10)
+            cache.put("new", io.BytesIO(b"cccc"))
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(cache.get("new").read(), b"cccc")
+
+    def test_cache_size_resolution(self):
+        config = SimpleNamespace(tts_cache_size_mb=None)
+        self.assertEqual(get_chunk_cache_max_bytes(config), 1024 * 1024 * 1024)
+        config.tts_cache_size_mb = 0
+        self.assertIsNone(get_chunk_cache_max_bytes(config))
+
+    def test_disabled_cache(self):
+        cache = ChunkCache(None, "wav")
+        cache.put("key", io.BytesIO(b"audio"))
+        self.assertIsNone(cache.get("key"))
+
+    def test_cache_dir_resolution(self):
+        config = SimpleNamespace(output_folder="out", tts_cache_dir=None, no_tts_cache=False)
+        self.assertEqual(get_chunk_cache_dir(config), os.path.join("out", ".tts_cache"))
+        config.tts_cache_dir = "elsewhere"
+        self.assertEqual(get_chunk_cache_dir(config), "elsewhere")
+        config.no_tts_cache = True
+        self.assertIsNone(get_chunk_cache_dir(config))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,11 @@ class TestSplitText(unittest.TestCase):
         
         # The lengths should be the same
         assert len(chunks_sans_whitespace) == len(original_sans_whitespace), "Content might be lost during splitting"
+
+    def test_text_within_limit(self):
+        """Text that fits in one chunk is returned whole."""
+        self.assertEqual(split_text("  First. Second.  ", 100, "en"), ["First. Second."])
+        self.assertEqual(split_text("   ", 100, "en"), [])
         
 
 if __name__ == "__main__":